@@ -1,11 +1,12 @@
 """Calendar OAuth and management API endpoints."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Dict, Any
 
 from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
 
 from app.services.calendar_auth import (
     save_calendar_token,
@@ -14,30 +15,18 @@ from app.services.calendar_auth import (
     is_calendar_connected,
 )
 from app.integrations.calendar.google_calendar import GoogleCalendarProvider
+from app.services.memory_utils import add_memory
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/calendar", tags=["calendar"])
-
-
-class ConnectCalendarResponse(BaseModel):
-    """Response for calendar connection request."""
-    provider: str
-    authorization_url: str
-    message: str
-
-
-class CalendarStatusResponse(BaseModel):
-    """Response for calendar status."""
-    connected_calendars: list[Dict[str, Any]]
-    available_providers: list[str]
+router = APIRouter(prefix="/calendar", tags=["calendar"], default_response_class=ORJSONResponse)
 
 
 @router.get("/connect/{provider}")
 async def connect_calendar(
     provider: str,
     user_id: str = Query(..., description="User ID to connect calendar for"),
-) -> ConnectCalendarResponse:
+) -> Dict[str, str]:
     """
     Generate OAuth authorization URL for connecting a calendar.
 
@@ -52,22 +41,22 @@ async def connect_calendar(
     """
     # Check if already connected
     if await is_calendar_connected(user_id, provider):
-        return ConnectCalendarResponse(
-            provider=provider,
-            authorization_url="",
-            message=f"{provider.title()} Calendar is already connected! To reconnect, disconnect first.",
-        )
+        return {
+            "provider": provider,
+            "authorization_url": "",
+            "message": f"{provider.title()} Calendar is already connected! To reconnect, disconnect first.",
+        }
 
     if provider == "google":
         try:
             calendar_provider = GoogleCalendarProvider(user_id=user_id)
             auth_url = calendar_provider.get_authorization_url()
 
-            return ConnectCalendarResponse(
-                provider=provider,
-                authorization_url=auth_url,
-                message=f"Click the link to connect your {provider.title()} Calendar",
-            )
+            return {
+                "provider": provider,
+                "authorization_url": auth_url,
+                "message": f"Click the link to connect your {provider.title()} Calendar",
+            }
         except Exception as exc:
             logger.exception(f"Failed to generate Google Calendar auth URL: {exc}")
             raise HTTPException(
@@ -129,17 +118,23 @@ async def google_calendar_callback(
 
         # Save tokens to database
         # Get credentials from provider
-        if calendar_provider.credentials:
-            await save_calendar_token(
-                user_id=user_id,
-                provider="google",
-                access_token=calendar_provider.credentials.token,
-                refresh_token=calendar_provider.credentials.refresh_token,
-                token_expiry=calendar_provider.credentials.expiry,
-                token_data={
-                    "scopes": calendar_provider.credentials.scopes,
-                    "token_uri": calendar_provider.credentials.token_uri,
-                },
+        credentials = calendar_provider.credentials
+        if credentials:
+            # Token save and the memory audit note are independent I/O;
+            # overlap them instead of awaiting sequentially.
+            await asyncio.gather(
+                save_calendar_token(
+                    user_id=user_id,
+                    provider="google",
+                    access_token=credentials.token,
+                    refresh_token=credentials.refresh_token,
+                    token_expiry=credentials.expiry,
+                    token_data={
+                        "scopes": credentials.scopes,
+                        "token_uri": credentials.token_uri,
+                    },
+                ),
+                add_memory("User connected their Google Calendar to Jenny.", user_id),
             )
 
         logger.info(f"Google Calendar connected successfully for user {user_id}")
@@ -206,7 +201,7 @@ async def disconnect_calendar(
 @router.get("/status")
 async def get_calendar_status(
     user_id: str = Query(..., description="User ID"),
-) -> CalendarStatusResponse:
+) -> Dict[str, Any]:
     """
     Get calendar connection status for a user.
 
@@ -218,10 +213,10 @@ async def get_calendar_status(
     """
     connected = await list_connected_calendars(user_id)
 
-    return CalendarStatusResponse(
-        connected_calendars=connected,
-        available_providers=["google", "microsoft", "apple"],
-    )
+    return {
+        "connected_calendars": connected,
+        "available_providers": ["google", "microsoft", "apple"],
+    }
 
 
 __all__ = ["router"]
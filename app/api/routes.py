@@ -0,0 +1,158 @@
+"""Core API endpoints for the Jenny orchestrator."""
+from __future__ import annotations
+
+import os
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+
+from app.core.cache import get_value, set_value
+from app.core.http import get_http_client
+from app.services.memory_utils import add_memory, search_memory
+from app.services.voice import transcribe_audio
+from app.crew.crew import get_crew
+
+MEMO_BASE_URL = os.getenv("MEMO_BASE_URL", "http://127.0.0.1:8081")
+# Formatted once at import; the probe URL never changes within a process.
+MEM0_HEALTH_URL = f"{MEMO_BASE_URL}/health"
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+class QueryPayload(BaseModel):
+    user_id: str = Field(..., min_length=1)
+    text: Optional[str] = None
+    voice_url: Optional[str] = None
+    image_url: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    @model_validator(mode="after")
+    def ensure_payload(self) -> "QueryPayload":
+        if not (self.text or self.voice_url or self.image_url):
+            raise ValueError("One of text, voice_url, or image_url must be provided")
+        return self
+
+
+class RememberPayload(BaseModel):
+    user_id: str = Field(..., min_length=1)
+    text: str = Field(..., min_length=1)
+
+
+@router.get("/health")
+async def healthcheck() -> dict[str, Any]:
+    """Return service health, probing the Mem0 microservice."""
+
+    # Serve a recent successful probe from Redis to absorb load-balancer polling.
+    try:
+        if await get_value("mem0:health") == "ok":
+            return {"ok": True, "mem0": True}
+    except Exception:  # noqa: BLE001 - Redis down; fall through to a direct probe
+        pass
+
+    mem0_ok = False
+    try:
+        client = await get_http_client()
+        response = await client.get(MEM0_HEALTH_URL)
+        mem0_ok = response.status_code == 200
+    except httpx.HTTPError:
+        mem0_ok = False
+
+    if mem0_ok:
+        try:
+            await set_value("mem0:health", "ok", ttl=3)
+        except Exception:  # noqa: BLE001
+            pass
+
+    return {"ok": True, "mem0": mem0_ok}
+
+
+@router.post("/ask")
+async def ask(payload: QueryPayload) -> dict:
+    """Process user query directly through CrewAI orchestrator."""
+
+    try:
+        user_id = payload.user_id
+
+        # Handle different input types
+        query_text = None
+
+        if payload.text:
+            query_text = payload.text
+        elif payload.voice_url:
+            # Transcribe voice
+            query_text = await transcribe_audio(payload.voice_url)
+            if not query_text:
+                return {
+                    "agent": "voice_transcription",
+                    "reply": "I could not understand the audio. Could you type it instead?",
+                }
+        elif payload.image_url:
+            return {
+                "agent": "image_analysis",
+                "reply": "Image messages are not yet supported. Please send text.",
+            }
+
+        if not query_text:
+            raise ValueError("No valid input provided")
+
+        # Process with CrewAI directly - it will use Mem0 for context
+        response = await get_crew().process_query(
+            query=query_text,
+            user_id=user_id,
+            context={"user_id": user_id, "metadata": payload.metadata or {}}
+        )
+
+        return response
+
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post("/ask/stream")
+async def ask_stream(payload: QueryPayload) -> StreamingResponse:
+    """Process a text query, streaming intermediate steps over SSE.
+
+    The client sees agent output as the crew produces it instead of
+    waiting for the full run; the last event (type "reply") matches the
+    /ask response body.
+    """
+
+    if not payload.text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Streaming supports text queries only",
+        )
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        events = get_crew().stream_query(
+            query=payload.text,
+            user_id=payload.user_id,
+            context={"user_id": payload.user_id, "metadata": payload.metadata or {}},
+        )
+        async for event in events:
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.post("/demo/remember")
+async def remember(payload: RememberPayload) -> dict:
+    """Directly add a memory via the memory agent."""
+
+    return await add_memory(payload.text, payload.user_id)
+
+
+@router.get("/demo/search")
+async def demo_search(user_id: str, q: str, k: int = 5) -> dict:
+    """Search stored memories via the memory agent."""
+
+    if not user_id or not q:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="user_id and q required")
+    return await search_memory(q, user_id, k=k)
+
+
+__all__ = ["router"]
@@ -4,8 +4,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
 from pathlib import Path
+from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import (
@@ -15,8 +18,11 @@ from telegram.ext import (
     MessageHandler,
     filters,
 )
+from telegram.request import HTTPXRequest
 
+from app.core.cache import get_value, set_value
 from app.core.db import init_pool
+from app.services.session import Turn, get_session_store
 from app.services.voice import transcribe_audio
 from app.crew.crew import get_crew
 
@@ -25,6 +31,17 @@ logger = logging.getLogger(__name__)
 ROOT_DIR = Path(__file__).resolve().parents[2]
 load_dotenv(ROOT_DIR / ".env", override=False)
 
+# Built once at import; the combinators allocate new filter objects each time
+TEXT_FILTER = filters.TEXT & ~filters.COMMAND
+VOICE_FILTER = filters.VOICE | filters.AUDIO
+
+
+class ORJSONRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Bot API payloads with orjson."""
+
+    def parse_json_payload(self, payload: bytes) -> dict:
+        return orjson.loads(payload)
+
 
 class TelegramJennyBot:
     """Telegram bot that connects directly to CrewAI orchestrator."""
@@ -32,22 +49,51 @@ class TelegramJennyBot:
     def __init__(self, token: str) -> None:
         self.token = token
         self.crew = get_crew()
-        init_pool()
-        self.application = Application.builder().token(self.token).build()
+        self.sessions = get_session_store()
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .request(ORJSONRequest())
+            .get_updates_request(ORJSONRequest())
+            .post_shutdown(self._drain_pending_tasks)
+            .build()
+        )
+        # Keep strong references so pending writes are not garbage collected
+        self._pending_tasks: set[asyncio.Task] = set()
         self._register_handlers()
 
     def _register_handlers(self) -> None:
         self.application.add_handler(CommandHandler("start", self._start))
         self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_text)
+            MessageHandler(TEXT_FILTER, self._handle_text)
         )
         self.application.add_handler(
-            MessageHandler(filters.VOICE | filters.AUDIO, self._handle_voice)
+            MessageHandler(VOICE_FILTER, self._handle_voice)
         )
         self.application.add_handler(
             MessageHandler(filters.PHOTO, self._handle_photo)
         )
 
+    def _persist_turn_later(
+        self, user_id: str, query: str, reply: str, agent: Optional[str] = None
+    ) -> None:
+        """Schedule the session write so the reply is not delayed by Redis."""
+
+        task = asyncio.create_task(
+            self.sessions.append_turn(
+                user_id,
+                Turn(user=query, assistant=reply, agent=agent, ts=time.time()),
+            )
+        )
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    async def _drain_pending_tasks(self, application: Application) -> None:
+        """Wait for any in-flight session writes before shutdown."""
+
+        if self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+
     async def _start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if update.effective_user:
             name = update.effective_user.first_name or update.effective_user.username
@@ -64,25 +110,33 @@ class TelegramJennyBot:
         user_id = str(update.effective_user.id)
         text = update.message.text
 
+        history = await self.sessions.get_context(user_id)
+
         # Process with CrewAI directly - it will use Mem0 for context
         response = await self.crew.process_query(
             query=text,
             user_id=user_id,
-            context={"user_id": user_id}
+            context={"user_id": user_id, "history": history}
         )
 
-        await update.message.reply_text(response.get("reply", "I processed your message."))
+        reply = response.get("reply", "I processed your message.")
+
+        # Persist in the background; the reply goes out first
+        self._persist_turn_later(user_id, text, reply, agent=response.get("agent"))
+        await update.message.reply_text(reply)
 
     async def _handle_voice(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if not update.message or not update.message.voice:
             return
 
         user_id = str(update.effective_user.id)
-        file = await context.bot.get_file(update.message.voice.file_id)
-        voice_url = file.file_path
+        voice_url = await self._resolve_file_path(context, update.message.voice.file_id)
 
-        # Transcribe audio
-        transcript = await transcribe_audio(voice_url)
+        # Transcription and the session fetch are independent; overlap them
+        transcript, history = await asyncio.gather(
+            transcribe_audio(voice_url),
+            self.sessions.get_context(user_id),
+        )
 
         if not transcript:
             await update.message.reply_text(
@@ -94,10 +148,37 @@ class TelegramJennyBot:
         response = await self.crew.process_query(
             query=transcript,
             user_id=user_id,
-            context={"user_id": user_id, "voice_url": voice_url}
+            context={"user_id": user_id, "voice_url": voice_url, "history": history}
         )
 
-        await update.message.reply_text(response.get("reply", "I processed the audio."))
+        reply = response.get("reply", "I processed the audio.")
+
+        self._persist_turn_later(user_id, transcript, reply, agent=response.get("agent"))
+        await update.message.reply_text(reply)
+
+    async def _resolve_file_path(
+        self, context: ContextTypes.DEFAULT_TYPE, file_id: str
+    ) -> str:
+        """Resolve a Telegram file_id to a download URL, cached in Redis.
+
+        Telegram file URLs stay valid for about an hour, so resent media
+        and retries skip the extra Bot API round trip.
+        """
+
+        cache_key = f"tgfile:{file_id}"
+        try:
+            cached = await get_value(cache_key)
+            if cached:
+                return cached
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Telegram file cache read failed: %s", exc)
+
+        file = await context.bot.get_file(file_id)
+        try:
+            await set_value(cache_key, file.file_path, ttl=3000)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Telegram file cache write failed: %s", exc)
+        return file.file_path
 
     async def _handle_photo(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if not update.message or not update.message.photo:
@@ -114,6 +195,15 @@ class TelegramJennyBot:
 
 
 def main() -> None:
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("uvloop event loop policy installed.")
+    except ImportError:
+        # uvloop is Linux/macOS only; fall back to the stdlib loop elsewhere
+        logger.info("uvloop not available; using the default asyncio loop.")
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -121,6 +211,7 @@ def main() -> None:
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not token:
         raise RuntimeError("TELEGRAM_BOT_TOKEN environment variable is required.")
+    init_pool()
     bot = TelegramJennyBot(token)
     bot.run()
 
@@ -4,18 +4,26 @@ from __future__ import annotations
 import os
 from typing import Optional
 
-from redis.asyncio import Redis
+from redis.asyncio import ConnectionPool, Redis
 
 _redis_client: Optional[Redis] = None
+_redis_pool: Optional[ConnectionPool] = None
 
 
 async def get_client() -> Redis:
-    """Return a singleton Redis client instance."""
+    """Return a singleton Redis client backed by an explicit connection pool."""
 
-    global _redis_client  # noqa: PLW0603
+    global _redis_client, _redis_pool  # noqa: PLW0603
     if _redis_client is None:
         redis_url = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
-        _redis_client = Redis.from_url(redis_url, decode_responses=True)
+        _redis_pool = ConnectionPool.from_url(
+            redis_url,
+            max_connections=50,
+            decode_responses=True,
+            health_check_interval=30,
+            socket_keepalive=True,
+        )
+        _redis_client = Redis(connection_pool=_redis_pool)
     return _redis_client
 
 
@@ -33,10 +41,20 @@ async def get_value(key: str) -> Optional[str]:
     return await client.get(key)
 
 
+async def delete_value(key: str) -> None:
+    """Delete a key if present."""
+
+    client = await get_client()
+    await client.delete(key)
+
+
 async def close_client() -> None:
     """Close the Redis connection if open."""
 
-    global _redis_client  # noqa: PLW0603
+    global _redis_client, _redis_pool  # noqa: PLW0603
     if _redis_client is not None:
         await _redis_client.close()
         _redis_client = None
+    if _redis_pool is not None:
+        await _redis_pool.disconnect()
+        _redis_pool = None
@@ -31,6 +31,12 @@ class Settings(BaseSettings):
     )
     neo4j_user: str = Field(default="neo4j", description="Neo4j username.")
     neo4j_password: str = Field(default="neo4jpass", description="Neo4j password.")
+    session_cleanup_interval: int = Field(
+        default=3600, description="Seconds between session cleanup passes."
+    )
+    session_idle_ttl: int = Field(
+        default=86400, description="Expiry applied to idle session keys, in seconds."
+    )
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
-from typing import Any, Iterable, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Optional
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
+import orjson
 import psycopg2
+from psycopg2 import extras
 from psycopg2.pool import ThreadedConnectionPool
 
 logger = logging.getLogger(__name__)
@@ -14,6 +24,10 @@ logger = logging.getLogger(__name__)
 _pool: Optional[ThreadedConnectionPool] = None
 _pool_enabled: bool = True
 
+# Dedicated executor sized to the pool so queries never queue behind the
+# default executor's min(32, cpu+4) cap while pooled connections sit idle.
+_executor: Optional[ThreadPoolExecutor] = None
+
 
 def _get_pool() -> Optional[ThreadedConnectionPool]:
     if not _pool_enabled:
@@ -23,10 +37,10 @@ def _get_pool() -> Optional[ThreadedConnectionPool]:
     return _pool
 
 
-def init_pool(minconn: int = 1, maxconn: int = 10) -> None:
+def init_pool(minconn: int = 2, maxconn: int = 20) -> None:
     """Initialise the global psycopg2 connection pool."""
 
-    global _pool, _pool_enabled  # noqa: PLW0603
+    global _pool, _pool_enabled, _executor  # noqa: PLW0603
     if _pool is not None:
         return
 
@@ -41,6 +55,8 @@ def init_pool(minconn: int = 1, maxconn: int = 10) -> None:
 
     try:
         _pool = ThreadedConnectionPool(minconn=minconn, maxconn=maxconn, **db_settings)
+        workers = int(os.getenv("THREAD_POOL_SIZE", maxconn))
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pg")
         logger.info("Postgres pool initialized successfully")
     except psycopg2.Error as exc:
         logger.warning("Failed to initialize Postgres pool: %s. Database features will be disabled.", exc)
@@ -50,10 +66,79 @@ def init_pool(minconn: int = 1, maxconn: int = 10) -> None:
 async def close_pool() -> None:
     """Close all connections in the pool."""
 
-    global _pool  # noqa: PLW0603
+    global _pool, _executor  # noqa: PLW0603
     if _pool is not None:
         await asyncio.get_running_loop().run_in_executor(None, _pool.closeall)
         _pool = None
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+# Server-side prepared statements, cached per connection. Pool connections
+# are long-lived, so repeated queries skip the parse/plan step entirely.
+_PREPARED_CACHE_SIZE = 64
+_PREPARABLE_VERBS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+_prepared_statements: "WeakKeyDictionary[Any, OrderedDict[str, str]]" = WeakKeyDictionary()
+
+
+def _can_prepare(query: str, params: Optional[Iterable[Any]]) -> bool:
+    if ";" in query or "%(" in query:
+        return False
+    if params is not None and not isinstance(params, (list, tuple)):
+        return False
+    return query.lstrip().upper().startswith(_PREPARABLE_VERBS)
+
+
+def _execute_prepared(cursor: Any, query: str, params: Optional[Iterable[Any]]) -> None:
+    conn = cursor.connection
+    cache = _prepared_statements.get(conn)
+    if cache is None:
+        cache = OrderedDict()
+        _prepared_statements[conn] = cache
+
+    name = cache.get(query)
+    if name is None:
+        digest = hashlib.blake2b(query.encode("utf-8"), digest_size=8).hexdigest()
+        name = f"jenny_ps_{digest}"
+        statement = query
+        for index in range(1, query.count("%s") + 1):
+            statement = statement.replace("%s", f"${index}", 1)
+        cursor.execute(f"PREPARE {name} AS {statement}")
+        cache[query] = name
+        if len(cache) > _PREPARED_CACHE_SIZE:
+            _, evicted = cache.popitem(last=False)
+            cursor.execute(f"DEALLOCATE {evicted}")
+    else:
+        cache.move_to_end(query)
+
+    if params:
+        placeholders = ", ".join(["%s"] * len(tuple(params)))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+def _execute(
+    cursor: Any, query: str, params: Optional[Iterable[Any]], in_pipeline: bool = False
+) -> None:
+    if not _can_prepare(query, params):
+        cursor.execute(query, params)
+        return
+    try:
+        _execute_prepared(cursor, query, params)
+    except psycopg2.errors.InvalidSqlStatementName:
+        # A rollback deallocated the statement server-side; drop the
+        # stale cache for this connection. On a dedicated one-statement
+        # connection we can roll back and recover in place, but inside a
+        # pipeline that rollback would silently discard the group's
+        # earlier statements and the exit commit would persist only the
+        # remainder — re-raise instead so the whole group rolls back.
+        _prepared_statements.pop(cursor.connection, None)
+        if in_pipeline:
+            raise
+        cursor.connection.rollback()
+        cursor.execute(query, params)
 
 
 def _run_query(query: str, params: Optional[Iterable[Any]], fetch: Optional[str]) -> Any:
@@ -61,11 +146,12 @@ def _run_query(query: str, params: Optional[Iterable[Any]], fetch: Optional[str]
     conn = pool.getconn()
     try:
         with conn.cursor() as cursor:
-            cursor.execute(query, params)
+            _execute(cursor, query, params)
             result = None
             if fetch == "one":
                 result = cursor.fetchone()
             elif fetch == "all":
+                # fetchall() already returns a list, possibly empty
                 result = cursor.fetchall()
             conn.commit()
             return result
@@ -76,23 +162,293 @@ def _run_query(query: str, params: Optional[Iterable[Any]], fetch: Optional[str]
         pool.putconn(conn)
 
 
+def _run_many(query: str, seq_of_params: list[Any], page_size: int) -> None:
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cursor:
+            extras.execute_batch(cursor, query, seq_of_params, page_size=page_size)
+            conn.commit()
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+def _run_insert_many(
+    table: str, columns: Iterable[str], rows: list[Any], page_size: int
+) -> None:
+    pool = _get_pool()
+    conn = pool.getconn()
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+    try:
+        with conn.cursor() as cursor:
+            extras.execute_values(cursor, query, rows, page_size=page_size)
+            conn.commit()
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+# The async wrappers below call loop.run_in_executor with the raw function
+# on purpose. Do not rewrite them on asyncio.to_thread: it adds a
+# contextvars.copy_context() plus a functools.partial wrapper on every
+# invocation, pure overhead on these hot paths since the workers read no
+# context variables.
 async def execute(query: str, params: Optional[Iterable[Any]] = None) -> None:
     """Execute a statement without returning results."""
 
     loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, _run_query, query, params, None)
+    await loop.run_in_executor(_executor, _run_query, query, params, None)
+
+
+async def execute_many(
+    query: str,
+    seq_of_params: Iterable[Iterable[Any]],
+    page_size: int = 100,
+) -> None:
+    """Execute a statement for each parameter set, batched per round trip."""
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_executor, _run_many, query, list(seq_of_params), page_size)
+
+
+async def insert_many(
+    table: str,
+    columns: Iterable[str],
+    rows: Iterable[Iterable[Any]],
+    page_size: int = 100,
+) -> None:
+    """Bulk-insert rows via execute_values (single VALUES list per batch)."""
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        _executor, _run_insert_many, table, list(columns), list(rows), page_size
+    )
 
 
 async def fetch_one(query: str, params: Optional[Iterable[Any]] = None) -> Any:
     """Return a single row from the database."""
 
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, _run_query, query, params, "one")
+    return await loop.run_in_executor(_executor, _run_query, query, params, "one")
 
 
 async def fetch_all(query: str, params: Optional[Iterable[Any]] = None) -> list[Any]:
     """Return multiple rows from the database."""
 
     loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(None, _run_query, query, params, "all")
-    return list(result or [])
+    return await loop.run_in_executor(_executor, _run_query, query, params, "all") or []
+
+
+def _run_copy_out(query: str, file: Any, fmt: str) -> None:
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cursor:
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT {fmt})", file)
+            conn.commit()
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+async def copy_out(query: str, file: Any, fmt: str = "binary") -> None:
+    """Stream a query's result into a file-like object via COPY TO STDOUT.
+
+    The server skips per-row text encoding and the client never builds a
+    row list, so large exports cost a fraction of fetch_all plus manual
+    re-encoding. Use fmt="csv" for text exports.
+    """
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_executor, _run_copy_out, query, file, fmt)
+
+
+class Pipeline:
+    """Runs a group of queries on one pooled connection.
+
+    Each run() is still one executor hop, but getconn/putconn and the
+    commit happen once for the whole group instead of once per query, so
+    an endpoint issuing several related statements pays the pool and
+    transaction overhead a single time.
+    """
+
+    def __init__(self, conn: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self._conn = conn
+        self._loop = loop
+
+    def _run(self, query: str, params: Optional[Iterable[Any]], fetch: Optional[str]) -> Any:
+        with self._conn.cursor() as cursor:
+            _execute(cursor, query, params, in_pipeline=True)
+            if fetch == "one":
+                return cursor.fetchone()
+            if fetch == "all":
+                return cursor.fetchall()
+            return None
+
+    async def run(
+        self,
+        query: str,
+        params: Optional[Iterable[Any]] = None,
+        fetch: Optional[str] = None,
+    ) -> Any:
+        return await self._loop.run_in_executor(_executor, self._run, query, params, fetch)
+
+
+@asynccontextmanager
+async def pipeline() -> AsyncIterator[Pipeline]:
+    """Yield a Pipeline whose queries share one connection and commit."""
+
+    pool = _get_pool()
+    loop = asyncio.get_running_loop()
+    conn = await loop.run_in_executor(_executor, pool.getconn)
+    try:
+        yield Pipeline(conn, loop)
+        await loop.run_in_executor(_executor, conn.commit)
+    except Exception:  # noqa: BLE001
+        await loop.run_in_executor(_executor, conn.rollback)
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+def _open_named_cursor(
+    query: str, params: Optional[Iterable[Any]], itersize: int
+) -> tuple[Any, Any]:
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        cursor = conn.cursor(name=f"jc_{uuid4().hex}")
+        cursor.itersize = itersize
+        cursor.execute(query, params)
+        return conn, cursor
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+        pool.putconn(conn)
+        raise
+
+
+def _close_named_cursor(conn: Any, cursor: Any) -> None:
+    try:
+        cursor.close()
+        conn.commit()
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+    finally:
+        _get_pool().putconn(conn)
+
+
+async def fetch_iter(
+    query: str,
+    params: Optional[Iterable[Any]] = None,
+    itersize: int = 2000,
+) -> AsyncIterator[Any]:
+    """Stream rows from a server-side cursor in chunks of ``itersize``.
+
+    Unlike fetch_all this never materializes the whole result set; peak
+    memory stays at one chunk and rows are yielded while the server is
+    still producing them.
+    """
+
+    loop = asyncio.get_running_loop()
+    conn, cursor = await loop.run_in_executor(
+        _executor, _open_named_cursor, query, params, itersize
+    )
+    try:
+        while True:
+            rows = await loop.run_in_executor(_executor, cursor.fetchmany, itersize)
+            if not rows:
+                break
+            for row in rows:
+                yield row
+    finally:
+        await loop.run_in_executor(_executor, _close_named_cursor, conn, cursor)
+
+
+# Short-lived result cache for hot read queries. Entries carry their own
+# expiry so callers can pick a TTL per query.
+_RESULT_CACHE_SIZE = 4096
+_result_cache: "OrderedDict[tuple[str, bytes], tuple[float, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _cache_key(query: str, params: Optional[Iterable[Any]]) -> tuple[str, bytes]:
+    # orjson serializes at C speed and, unlike a raw tuple() key, handles
+    # unhashable params (dicts, lists); OPT_SORT_KEYS keeps dict params
+    # order-insensitive and default=str covers driver types like Decimal.
+    return (
+        query,
+        orjson.dumps(
+            list(params) if params else [],
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        ),
+    )
+
+
+def _cache_get(key: tuple[str, tuple[Any, ...]]) -> Any:
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: tuple[str, tuple[Any, ...]], value: Any, ttl: float) -> None:
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic() + ttl, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+async def fetch_one_cached(
+    query: str, params: Optional[Iterable[Any]] = None, ttl: float = 5.0
+) -> Any:
+    """Return a single row, serving repeats from a short-lived cache."""
+
+    key = _cache_key(query, params)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    result = await fetch_one(query, params)
+    if result is not None:
+        _cache_put(key, result, ttl)
+    return result
+
+
+async def fetch_all_cached(
+    query: str, params: Optional[Iterable[Any]] = None, ttl: float = 5.0
+) -> list[Any]:
+    """Return multiple rows, serving repeats from a short-lived cache."""
+
+    key = _cache_key(query, params)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    result = await fetch_all(query, params)
+    _cache_put(key, result, ttl)
+    return result
+
+
+def invalidate_cached(sql_prefix: Optional[str] = None) -> None:
+    """Drop cached results, optionally only those whose SQL starts with a prefix."""
+
+    with _result_cache_lock:
+        if sql_prefix is None:
+            _result_cache.clear()
+            return
+        stale = [key for key in _result_cache if key[0].startswith(sql_prefix)]
+        for key in stale:
+            del _result_cache[key]
@@ -1,13 +1,19 @@
 """Basic Neo4j helper functions."""
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from neo4j import AsyncDriver, AsyncGraphDatabase
 from neo4j.exceptions import Neo4jError
 
+logger = logging.getLogger(__name__)
+
 _driver: Optional[AsyncDriver] = None
+_driver_lock = asyncio.Lock()
 
 
 def _get_credentials() -> tuple[str, str, str]:
@@ -22,8 +28,24 @@ async def get_driver() -> AsyncDriver:
 
     global _driver  # noqa: PLW0603
     if _driver is None:
-        uri, user, password = _get_credentials()
-        _driver = AsyncGraphDatabase.driver(uri, auth=(user, password))
+        async with _driver_lock:
+            if _driver is None:
+                uri, user, password = _get_credentials()
+                pool_size = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+                acquisition_timeout = float(os.getenv("NEO4J_ACQ_TIMEOUT", "5"))
+                _driver = AsyncGraphDatabase.driver(
+                    uri,
+                    auth=(user, password),
+                    max_connection_pool_size=pool_size,
+                    connection_acquisition_timeout=acquisition_timeout,
+                    max_connection_lifetime=3600,
+                    keep_alive=True,
+                )
+                logger.info(
+                    "Neo4j driver created (pool_size=%d, acquisition_timeout=%.1fs)",
+                    pool_size,
+                    acquisition_timeout,
+                )
     return _driver
 
 
@@ -36,18 +58,43 @@ async def close_driver() -> None:
         _driver = None
 
 
-async def create_node(label: str, properties: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a node with the provided label and properties."""
+async def create_nodes(
+    label: str, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Create many nodes in a single UNWIND round trip."""
+
+    if not rows:
+        return []
 
     driver = await get_driver()
-    cypher = f"CREATE (n:{label} $props) RETURN n"
+    cypher = f"UNWIND $rows AS props CREATE (n:{label}) SET n = props RETURN n"
     try:
-        async with driver.session() as session:
-            result = await session.run(cypher, props=properties)
-            record = await result.single()
-            return record["n"]._properties if record else {}
+        records, _, _ = await driver.execute_query(cypher, rows=rows)
+        return [record["n"]._properties for record in records]
     except Neo4jError as exc:  # noqa: BLE001
-        raise RuntimeError("Failed to create node") from exc
+        raise RuntimeError("Failed to create nodes") from exc
+
+
+async def create_node(label: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a node with the provided label and properties."""
+
+    created = await create_nodes(label, [properties])
+    return created[0] if created else {}
+
+
+# Cypher text is cached per (label, match-key) shape. Keys are sorted so
+# dict insertion order never causes a miss, and identical query text also
+# keeps Neo4j's own plan cache warm.
+@lru_cache(maxsize=256)
+def _build_find_cypher(label: str, keys: tuple[str, ...]) -> str:
+    where_clauses = " AND ".join(f"n.{key} = ${key}" for key in keys) or "true"
+    return f"MATCH (n:{label}) WHERE {where_clauses} RETURN n LIMIT $limit"
+
+
+@lru_cache(maxsize=256)
+def _build_delete_cypher(label: str, keys: tuple[str, ...]) -> str:
+    where_clauses = " AND ".join(f"n.{key} = ${key}" for key in keys) or "true"
+    return f"MATCH (n:{label}) WHERE {where_clauses} DETACH DELETE n"
 
 
 async def find_nodes(
@@ -58,15 +105,12 @@ async def find_nodes(
     """Return nodes matching the provided criteria."""
 
     driver = await get_driver()
-    where_clauses = " AND ".join(f"n.{key} = ${key}" for key in match) or "true"
-    cypher = f"MATCH (n:{label}) WHERE {where_clauses} RETURN n LIMIT $limit"
+    cypher = _build_find_cypher(label, tuple(sorted(match)))
     params = {**match, "limit": limit}
 
     try:
-        async with driver.session() as session:
-            result = await session.run(cypher, params)
-            records = await result.to_list()
-            return [record["n"]._properties for record in records]
+        records, _, _ = await driver.execute_query(cypher, params)
+        return [record["n"]._properties for record in records]
     except Neo4jError as exc:  # noqa: BLE001
         raise RuntimeError("Failed to query nodes") from exc
 
@@ -75,11 +119,32 @@ async def delete_nodes(label: str, match: Dict[str, Any]) -> None:
     """Delete nodes matching the provided properties."""
 
     driver = await get_driver()
-    where_clauses = " AND ".join(f"n.{key} = ${key}" for key in match) or "true"
-    cypher = f"MATCH (n:{label}) WHERE {where_clauses} DETACH DELETE n"
+    cypher = _build_delete_cypher(label, tuple(sorted(match)))
+
+    try:
+        await driver.execute_query(cypher, match)
+    except Neo4jError as exc:  # noqa: BLE001
+        raise RuntimeError("Failed to delete nodes") from exc
+
+
+async def delete_nodes_bulk(label: str, criteria: List[Dict[str, Any]]) -> None:
+    """Delete nodes for many match dicts in a single UNWIND round trip.
+
+    All criteria dicts must share the same key set; the predicate is
+    built from the first entry.
+    """
+
+    if not criteria:
+        return
+
+    driver = await get_driver()
+    keys = tuple(sorted(criteria[0]))
+    where_clauses = " AND ".join(f"n.{key} = x.{key}" for key in keys) or "true"
+    cypher = (
+        f"UNWIND $c AS x MATCH (n:{label}) WHERE {where_clauses} DETACH DELETE n"
+    )
 
     try:
-        async with driver.session() as session:
-            await session.run(cypher, match)
+        await driver.execute_query(cypher, c=criteria)
     except Neo4jError as exc:  # noqa: BLE001
         raise RuntimeError("Failed to delete nodes") from exc
@@ -0,0 +1,29 @@
+"""Shared httpx client helpers."""
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Return a singleton AsyncClient with keep-alive pooling."""
+
+    global _client  # noqa: PLW0603
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=2.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client if open."""
+
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,40 @@
+"""Shared background event loop for synchronous tool entry points.
+
+CrewAI calls tools through their synchronous ``_run`` methods from
+worker threads. ``asyncio.run`` there would spin up and tear down a
+fresh event loop — and with it every client connection pool — on each
+tool invocation. Instead, one loop runs forever in a daemon thread and
+all tool coroutines are submitted to it, keeping Redis/Mem0/calendar
+connection pools warm across calls.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop  # noqa: PLW0603
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="crew-loop", daemon=True
+                )
+                thread.start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the shared loop and block for its result."""
+
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+__all__ = ["run_sync"]
@@ -1,14 +1,24 @@
 """CrewAI Crew for Jenny - Multi-agent orchestration following official best practices."""
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List
-
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from langchain_openai import ChatOpenAI
 
+from app.core.cache import get_value, set_value
+from app.crew.router import get_router
 from app.crew.tools import (
     MemorySearchTool,
     MemoryAddTool,
@@ -20,14 +30,39 @@ from app.crew.tools import (
     CalendarListEventsTool,
     CalendarCreateEventTool,
     CalendarSearchEventsTool,
+    CompositeContextTool,
 )
 
 logger = logging.getLogger(__name__)
 
+# CrewAI's verbose mode renders rich traces per request; keep it off in
+# production and flip on via env when debugging.
+_VERBOSE = os.getenv("JENNY_CREW_VERBOSE", "0") == "1"
+
+
+# Tools are stateless; build each once and share across agents and crew
+# rebuilds instead of re-instantiating them per agent factory call.
+_MEMORY_SEARCH = MemorySearchTool()
+_MEMORY_ADD = MemoryAddTool()
+_MEMORY_CONTEXT = MemoryContextTool()
+_TASK_CREATE = TaskCreateTool()
+_TASK_LIST = TaskListTool()
+_TASK_COMPLETE = TaskCompleteTool()
+_TASK_DELETE = TaskDeleteTool()
+_CALENDAR_LIST = CalendarListEventsTool()
+_CALENDAR_CREATE = CalendarCreateEventTool()
+_CALENDAR_SEARCH = CalendarSearchEventsTool()
+_COMPOSITE_CONTEXT = CompositeContextTool()
 
+
+@functools.lru_cache(maxsize=1)
 def get_llm():
     """
-    Get the LLM instance for CrewAI agents.
+    Get the shared LLM instance for CrewAI agents.
+
+    Memoized: every agent (and the hierarchical manager) reuses one client
+    object, so there is a single httpx connection pool instead of one per
+    agent and construction cost is paid once per process.
 
     Supports multiple providers via CREWAI_LLM_PROVIDER environment variable:
     - openai: OpenAI GPT models (default)
@@ -37,6 +72,11 @@ def get_llm():
     Returns:
         LLM instance for use by CrewAI agents
     """
+    # Imported here rather than at module level: langchain_openai pulls in
+    # a large dependency tree, and thanks to the lru_cache above the import
+    # cost is only ever paid once, on the first crew build.
+    from langchain_openai import ChatOpenAI
+
     llm_provider = os.getenv("CREWAI_LLM_PROVIDER", "openai").lower()
 
     if llm_provider == "deepseek":
@@ -98,12 +138,12 @@ class JennyCrew:
         return Agent(
             config=self.agents_config['memory_keeper'],
             tools=[
-                MemorySearchTool(),
-                MemoryAddTool(),
-                MemoryContextTool(),
+                _MEMORY_SEARCH,
+                _MEMORY_ADD,
+                _MEMORY_CONTEXT,
             ],
             llm=get_llm(),
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=False,
         )
 
@@ -113,13 +153,13 @@ class JennyCrew:
         return Agent(
             config=self.agents_config['task_coordinator'],
             tools=[
-                TaskCreateTool(),
-                TaskListTool(),
-                TaskCompleteTool(),
-                TaskDeleteTool(),
+                _TASK_CREATE,
+                _TASK_LIST,
+                _TASK_COMPLETE,
+                _TASK_DELETE,
             ],
             llm=get_llm(),
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=False,
         )
 
@@ -129,12 +169,12 @@ class JennyCrew:
         return Agent(
             config=self.agents_config['calendar_coordinator'],
             tools=[
-                CalendarListEventsTool(),
-                CalendarCreateEventTool(),
-                CalendarSearchEventsTool(),
+                _CALENDAR_LIST,
+                _CALENDAR_CREATE,
+                _CALENDAR_SEARCH,
             ],
             llm=get_llm(),
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=False,
         )
 
@@ -144,12 +184,12 @@ class JennyCrew:
         return Agent(
             config=self.agents_config['profile_manager'],
             tools=[
-                MemorySearchTool(),
-                MemoryAddTool(),
-                MemoryContextTool(),
+                _MEMORY_SEARCH,
+                _MEMORY_ADD,
+                _MEMORY_CONTEXT,
             ],
             llm=get_llm(),
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=False,
         )
 
@@ -164,11 +204,12 @@ class JennyCrew:
         return Agent(
             config=self.agents_config['general_assistant'],
             tools=[
-                MemorySearchTool(),
-                MemoryContextTool(),
+                _MEMORY_SEARCH,
+                _MEMORY_CONTEXT,
+                _COMPOSITE_CONTEXT,
             ],
             llm=get_llm(),
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=True,  # Can delegate to specialist agents
         )
 
@@ -210,7 +251,8 @@ class JennyCrew:
             tasks=self.tasks,     # Automatically populated by @task decorators
             process=Process.hierarchical,  # ✅ Intelligent automatic routing!
             manager_llm=get_llm(),  # LLM for the manager agent
-            verbose=True,
+            verbose=_VERBOSE,
+            step_callback=_emit_step,
         )
 
 
@@ -218,6 +260,109 @@ class JennyCrew:
 # Helper class for easier integration
 # ============================================
 
+# Reply caching: answers keyed on (user, query) skip the whole crew run.
+# Queries mentioning relative time are never cached — they go stale.
+REPLY_CACHE_TTL = 900
+SEMANTIC_CACHE_SIZE = 50
+SEMANTIC_THRESHOLD = 0.95
+_TIME_TOKENS = frozenset(
+    ("now", "today", "tonight", "tomorrow", "yesterday", "currently")
+)
+
+
+# Small talk answered without a crew run: greetings and sign-offs don't
+# need agents, tools, or an LLM round trip. Exact matches go through the
+# frozenset; short variants like "thanks a lot!" through one regex.
+_SMALL_TALK = frozenset(
+    (
+        "hi", "hii", "hiya", "hey", "heya", "hello", "hello there", "yo",
+        "hi there", "hey there", "good morning", "good afternoon",
+        "good evening", "good night", "morning", "evening", "howdy",
+        "what's up", "whats up", "sup", "how are you", "how are you doing",
+        "how's it going", "hows it going", "thanks", "thank you",
+        "thank you so much", "thx", "ty", "ok", "okay", "cool", "great",
+        "bye", "goodbye", "see you", "see ya", "later", "good day",
+    )
+)
+# Tails are a fixed whitelist, not free-form words: an open-ended tail
+# would full-match "thanks remind me tomorrow" and swallow the command.
+_SMALL_TALK_RE = re.compile(
+    r"^(?:hi+|hey+|hello+"
+    r"|(?:thanks?|thank\s+you|thx|ty)(?:\s+(?:a\s+lot|so\s+much|very\s+much|again))?"
+    r"|(?:good)?bye+(?:\s+for\s+now)?)$"
+)
+_GREETING_REPLIES = (
+    "Hi! How can I help you today?",
+    "Hello! What can I do for you?",
+    "Hey there! What do you need?",
+)
+_THANKS_REPLIES = (
+    "You're welcome! Anything else I can help with?",
+    "Happy to help! Let me know if you need anything else.",
+    "Anytime! Just ask if there's more I can do.",
+)
+_FAREWELL_REPLIES = (
+    "Goodbye! Talk to you soon.",
+    "See you later! I'm here whenever you need me.",
+    "Bye! Have a great day.",
+)
+_THANKS_RE = re.compile(r"\b(?:thanks?|thank|thx|ty)\b")
+_FAREWELL_RE = re.compile(r"\b(?:bye+|goodbye|see\s+(?:you|ya)|later|good\s+night)\b")
+
+
+def _small_talk_reply(query: str) -> str | None:
+    """Return a canned reply for pure small talk, else None."""
+    normalized = query.strip().lower().rstrip(".!?,")
+    if normalized not in _SMALL_TALK and not _SMALL_TALK_RE.match(normalized):
+        return None
+    if _THANKS_RE.search(normalized):
+        return random.choice(_THANKS_REPLIES)
+    if _FAREWELL_RE.search(normalized):
+        return random.choice(_FAREWELL_REPLIES)
+    return random.choice(_GREETING_REPLIES)
+
+
+_CACHE_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def _is_cacheable(query: str) -> bool:
+    # Regex tokenization, not str.split: "today?" must still match the
+    # time token list or date-sensitive replies get cached.
+    return _TIME_TOKENS.isdisjoint(_CACHE_TOKEN_RE.findall(query.lower()))
+
+
+# Streaming support: the crews are shared across concurrent requests, so
+# a per-request callback cannot be attached to them. Instead each kickoff
+# runs on one executor thread for its whole duration, and the module-wide
+# step callback looks up that thread's sink to forward intermediate agent
+# output to the right request's queue.
+_STEP_SINKS: Dict[int, Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Any]"]] = {}
+_STREAM_DONE = object()
+
+
+def _emit_step(step_output: Any) -> None:
+    sink = _STEP_SINKS.get(threading.get_ident())
+    if sink is None:
+        return
+    loop, queue = sink
+    text = getattr(step_output, "raw", None) or getattr(step_output, "output", None)
+    loop.call_soon_threadsafe(queue.put_nowait, str(text if text is not None else step_output))
+
+
+def _extract_reply(result: Any) -> str:
+    """Pull the reply text out of a CrewAI kickoff result."""
+    if hasattr(result, "raw"):
+        return result.raw
+    if isinstance(result, str):
+        return result
+    return str(result)
+
+
+def _reply_cache_key(user_id: str, query: str) -> str:
+    digest = hashlib.sha256(f"{user_id}|{query}".encode()).hexdigest()
+    return f"reply:{digest}"
+
+
 class JennyCrewRunner:
     """
     Wrapper class for running Jenny crew with custom inputs.
@@ -225,12 +370,157 @@ class JennyCrewRunner:
     This makes it easier to integrate with the existing FastAPI app.
     """
 
+    # Specialists that get a pre-built single-agent crew; general queries
+    # keep the hierarchical crew since its manager can still delegate.
+    _SPECIALISTS = (
+        "memory_keeper",
+        "task_coordinator",
+        "calendar_coordinator",
+        "profile_manager",
+    )
+
     def __init__(self):
-        """Initialize the crew (created once, reused for all queries)."""
+        """Initialize the crews (created once, reused for all queries)."""
         logger.info("Initializing Jenny crew...")
-        self._crew_instance = JennyCrew().crew()
+        jenny = JennyCrew()
+        self._crew_instance = jenny.crew()
+        # One sequential crew per specialist, built once: when the router
+        # is confident, kickoff goes straight to the specialist and skips
+        # the manager's delegation round trip and per-query Crew/Task
+        # construction entirely.
+        self._agent_crews: Dict[str, Crew] = {}
+        for name in self._SPECIALISTS:
+            specialist = getattr(jenny, name)()
+            self._agent_crews[name] = Crew(
+                agents=[specialist],
+                tasks=[Task(config=jenny.tasks_config["handle_user_query"], agent=specialist)],
+                process=Process.sequential,
+                verbose=_VERBOSE,
+                step_callback=_emit_step,
+            )
+        # Bounded pool for kickoffs: caps concurrent crew runs (and the
+        # LLM spend/rate-limit pressure each one carries) instead of
+        # letting every request spawn its own thread.
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("CREW_POOL_SIZE", "4")),
+            thread_name_prefix="crew",
+        )
+        # Per-user (embedding, reply, expiry) entries for near-duplicate hits
+        self._semantic_cache: Dict[str, List[tuple]] = {}
         logger.info("Jenny crew initialized successfully")
 
+    def _semantic_lookup(self, user_id: str, vec: np.ndarray) -> str | None:
+        entries = self._semantic_cache.get(user_id)
+        if not entries:
+            return None
+        now = time.monotonic()
+        live = [entry for entry in entries if entry[2] > now]
+        self._semantic_cache[user_id] = live
+        for cached_vec, reply, _ in live:
+            if float(cached_vec @ vec) >= SEMANTIC_THRESHOLD:
+                return reply
+        return None
+
+    def _semantic_store(self, user_id: str, vec: np.ndarray, reply: str) -> None:
+        entries = self._semantic_cache.setdefault(user_id, [])
+        entries.append((vec, reply, time.monotonic() + REPLY_CACHE_TTL))
+        del entries[:-SEMANTIC_CACHE_SIZE]
+
+    def close(self) -> None:
+        """Shut down the kickoff executor (called from lifespan shutdown)."""
+        self._executor.shutdown(wait=True)
+
+    async def _preflight(
+        self, query: str, user_id: str, context: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[Crew, Dict[str, str], str, Optional[np.ndarray], bool]]]:
+        """Run the shortcut and routing phase shared by both entry points.
+
+        Returns ``(shortcut_result, None)`` when the query is answered
+        without a crew run (small talk, cache hit), or ``(None, plan)``
+        where the plan carries everything the kickoff needs.
+        """
+        # Pure small talk never reaches the crew: a canned reply is
+        # indistinguishable from an LLM one here and costs nothing.
+        small_talk = _small_talk_reply(query)
+        if small_talk is not None:
+            return {"agent": "small_talk", "reply": small_talk, "success": True}, None
+
+        cacheable = _is_cacheable(query)
+        if cacheable:
+            cached_reply = await get_value(_reply_cache_key(user_id, query))
+            if cached_reply:
+                return {"agent": "cache", "reply": cached_reply, "success": True}, None
+
+        # One embedding + cosine search picks the likely specialist;
+        # the hint lets the manager delegate without a reasoning pass.
+        # The query vector for the semantic cache is computed in the
+        # same executor call: routing's keyword fast path never embeds,
+        # so the vector can't be assumed cached, and an embed call on
+        # the loop would block every other request for the round trip.
+        suggested_agent, query_vec = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(get_router().route_and_embed, query, embed=cacheable),
+        )
+
+        if query_vec is not None:
+            semantic_reply = self._semantic_lookup(user_id, query_vec)
+            if semantic_reply:
+                return {"agent": "cache", "reply": semantic_reply, "success": True}, None
+
+        # Context string built as a list + single join: no quadratic
+        # concatenation and one allocation regardless of history size.
+        parts = [
+            f"User ID: {user_id}.",
+            f"Suggested specialist agent: {suggested_agent}.",
+        ]
+        history = (context or {}).get("history") or []
+        if history:
+            parts.append("Recent conversation:")
+            for turn in history[-3:]:
+                parts.append(f"  user: {turn.get('user', '')}")
+                parts.append(f"  assistant: {turn.get('assistant', '')}")
+
+        # Prepare inputs for the crew
+        # CrewAI will use Mem0 tools to get context automatically
+        inputs = {
+            "query": query,
+            "user_id": user_id,
+            "context": "\n".join(parts),
+        }
+
+        crew_to_run = self._agent_crews.get(suggested_agent, self._crew_instance)
+        return None, (crew_to_run, inputs, suggested_agent, query_vec, cacheable)
+
+    async def _finalize(
+        self,
+        reply: str,
+        query: str,
+        user_id: str,
+        query_vec: Optional[np.ndarray],
+        cacheable: bool,
+    ) -> None:
+        """Populate both reply-cache tiers after a successful crew run."""
+        if cacheable:
+            await set_value(_reply_cache_key(user_id, query), reply, ttl=REPLY_CACHE_TTL)
+            if query_vec is not None:
+                self._semantic_store(user_id, query_vec, reply)
+
+    def _kickoff_with_sink(
+        self,
+        crew_to_run: Crew,
+        inputs: Dict[str, str],
+        loop: asyncio.AbstractEventLoop,
+        queue: "asyncio.Queue[Any]",
+    ) -> Any:
+        """Run kickoff with this thread's step output routed to a queue."""
+        ident = threading.get_ident()
+        _STEP_SINKS[ident] = (loop, queue)
+        try:
+            return crew_to_run.kickoff(inputs=inputs)
+        finally:
+            del _STEP_SINKS[ident]
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_DONE)
+
     async def process_query(self, query: str, user_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a user query using the crew.
@@ -244,32 +534,34 @@ class JennyCrewRunner:
             Dictionary with agent response
         """
         try:
-            logger.info(f"Processing query for user {user_id}: {query}")
-
-            # Prepare inputs for the crew
-            # CrewAI will use Mem0 tools to get context automatically
-            inputs = {
-                "query": query,
-                "user_id": user_id,
-                "context": f"User ID: {user_id}",  # Minimal context - Mem0 handles the rest
-            }
-
-            # Execute the crew (synchronous call, but we're in async context)
-            # CrewAI's kickoff is synchronous
-            result = self._crew_instance.kickoff(inputs=inputs)
+            logger.debug("Processing query for user %s", user_id)
+
+            shortcut, plan = await self._preflight(query, user_id, context)
+            if shortcut is not None:
+                return shortcut
+            crew_to_run, inputs, suggested_agent, query_vec, cacheable = plan
+
+            # kickoff() is synchronous and does blocking LLM/tool I/O;
+            # running it inline would stall the event loop for the whole
+            # crew run, serializing every other request behind it. The
+            # bounded executor is preferred over crew.kickoff_async():
+            # it offloads identically while also capping concurrent runs
+            # (and the LLM requests-per-minute they generate), which the
+            # unbounded async variant does not.
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                functools.partial(crew_to_run.kickoff, inputs=inputs),
+            )
+            reply = _extract_reply(result)
 
-            # Extract response from CrewAI result
-            if hasattr(result, 'raw'):
-                reply = result.raw
-            elif isinstance(result, str):
-                reply = result
-            else:
-                reply = str(result)
+            logger.debug("Crew completed (agent=%s)", suggested_agent)
 
-            logger.info("Crew completed successfully")
+            await self._finalize(reply, query, user_id, query_vec, cacheable)
 
             return {
-                "agent": "hierarchical_crew",  # Manager delegated
+                "agent": suggested_agent
+                if suggested_agent in self._agent_crews
+                else "hierarchical_crew",
                 "reply": reply,
                 "success": True,
             }
@@ -283,6 +575,60 @@ class JennyCrewRunner:
                 "error": str(exc),
             }
 
+    async def stream_query(
+        self, query: str, user_id: str, context: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user query, yielding incremental events.
+
+        Each event is a dict with a "type" key: "step" events carry
+        intermediate agent output as the crew works, and the single
+        final "reply" event carries the same payload process_query
+        returns. Shortcut answers (small talk, cache hits) emit just
+        the final event, so first bytes reach the client as soon as
+        the crew produces anything instead of after full generation.
+        """
+        try:
+            shortcut, plan = await self._preflight(query, user_id, context)
+            if shortcut is not None:
+                yield {"type": "reply", **shortcut}
+                return
+            crew_to_run, inputs, suggested_agent, query_vec, cacheable = plan
+
+            loop = asyncio.get_running_loop()
+            queue: "asyncio.Queue[Any]" = asyncio.Queue()
+            kickoff = loop.run_in_executor(
+                self._executor,
+                functools.partial(self._kickoff_with_sink, crew_to_run, inputs, loop, queue),
+            )
+            while True:
+                item = await queue.get()
+                if item is _STREAM_DONE:
+                    break
+                yield {"type": "step", "text": item}
+            reply = _extract_reply(await kickoff)
+
+            await self._finalize(reply, query, user_id, query_vec, cacheable)
+
+            yield {
+                "type": "reply",
+                "agent": suggested_agent
+                if suggested_agent in self._agent_crews
+                else "hierarchical_crew",
+                "reply": reply,
+                "success": True,
+            }
+
+        except Exception as exc:
+            logger.exception(f"Error streaming query: {exc}")
+            yield {
+                "type": "reply",
+                "agent": "error",
+                "reply": f"I encountered an error: {str(exc)}. Please try again.",
+                "success": False,
+                "error": str(exc),
+            }
+
     def get_agent_info(self) -> Dict[str, str]:
         """Get information about all available agents."""
         return {
@@ -299,19 +645,26 @@ class JennyCrewRunner:
 # Singleton instance
 # ============================================
 
-_crew_runner = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_crew() -> JennyCrewRunner:
     """
     Get the singleton Jenny crew runner instance.
 
-    The crew is created once and reused for all queries.
+    The crew is created once and reused for all queries. lru_cache locks
+    around the first call, so two threads racing on a cold start cannot
+    both build the (expensive) crew.
+    """
+    return JennyCrewRunner()
+
+
+async def warm() -> None:
+    """
+    Build the crew singleton ahead of the first request.
+
+    Agent/LLM/tool construction is heavyweight and synchronous, so run it
+    in an executor during startup instead of on the first user query.
     """
-    global _crew_runner
-    if _crew_runner is None:
-        _crew_runner = JennyCrewRunner()
-    return _crew_runner
+    await asyncio.get_running_loop().run_in_executor(None, get_crew)
 
 
-__all__ = ["JennyCrew", "JennyCrewRunner", "get_crew"]
+__all__ = ["JennyCrew", "JennyCrewRunner", "get_crew", "warm"]
@@ -0,0 +1,225 @@
+"""Semantic agent routing for crew queries.
+
+Routes a query to the most likely specialist agent with one embedding
+call and a 5-way cosine search over precomputed route centroids, instead
+of leaving the choice entirely to the hierarchical manager's LLM
+reasoning pass. The result is passed to the crew as a routing hint.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = os.getenv("ROUTER_EMBEDDING_MODEL", "text-embedding-3-small")
+
+# Reference phrases per agent; centroids are the mean of their embeddings.
+ROUTE_REFERENCES: Dict[str, List[str]] = {
+    "memory_keeper": [
+        "remember that my sister's birthday is in June",
+        "what did I tell you about Alice",
+        "don't forget that I prefer window seats",
+        "recall what I said about the project deadline",
+    ],
+    "task_coordinator": [
+        "remind me to call the dentist tomorrow",
+        "add buy groceries to my todo list",
+        "mark the report task as done",
+        "what tasks do I have pending",
+    ],
+    "calendar_coordinator": [
+        "what's on my schedule this week",
+        "book a meeting with Sam on Friday at 3pm",
+        "am I free tomorrow afternoon",
+        "move my standup to 10am",
+    ],
+    "profile_manager": [
+        "change my preferred language to Spanish",
+        "update my home address",
+        "I'd rather get notifications in the evening",
+        "set my timezone to Berlin",
+    ],
+    "general_assistant": [
+        "hi, how are you",
+        "tell me a joke",
+        "what can you do",
+        "thanks, that's all for now",
+    ],
+}
+
+
+# Unambiguous keywords short-circuit routing without an embedding call.
+# Single words are matched by hashing each query token against one dict;
+# multi-word phrases go through one compiled alternation, so the whole
+# fast path is a tokenize plus a single C-level scan.
+WORD_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "memory_keeper": ("remember", "forget", "recall", "memory", "memories"),
+    "task_coordinator": ("task", "tasks", "todo", "todos", "remind", "reminder", "reminders", "checklist"),
+    "calendar_coordinator": ("calendar", "meeting", "meetings", "schedule", "appointment", "appointments", "busy"),
+    "profile_manager": ("preference", "preferences", "profile", "timezone", "language", "notification", "notifications"),
+}
+
+PHRASE_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "memory_keeper": ("told you",),
+    "task_coordinator": ("to-do",),
+    "calendar_coordinator": ("am i free",),
+    "profile_manager": ("time zone",),
+}
+
+_WORD_TO_AGENT: Dict[str, str] = {
+    word: agent_name
+    for agent_name, words in WORD_ROUTES.items()
+    for word in words
+}
+_PHRASE_TO_AGENT: Dict[str, str] = {
+    phrase: agent_name
+    for agent_name, phrases in PHRASE_ROUTES.items()
+    for phrase in phrases
+}
+# Longest-first so overlapping phrases prefer the more specific match
+_PHRASE_RE = re.compile(
+    "|".join(sorted(map(re.escape, _PHRASE_TO_AGENT), key=len, reverse=True))
+)
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+# ASCII queries (the overwhelming majority) are case-folded with one
+# bytes.translate over a 256-entry table — a tight C loop that skips the
+# full Unicode case-folding machinery — and scanned with bytes patterns.
+# Non-ASCII queries fall back to the str variants above.
+_LOWER_TABLE = bytes.maketrans(bytes(range(256)), bytes(range(256)).lower())
+_WORD_TO_AGENT_B: Dict[bytes, str] = {
+    word.encode(): agent_name for word, agent_name in _WORD_TO_AGENT.items()
+}
+_PHRASE_TO_AGENT_B: Dict[bytes, str] = {
+    phrase.encode(): agent_name for phrase, agent_name in _PHRASE_TO_AGENT.items()
+}
+_PHRASE_RE_B = re.compile(
+    b"|".join(sorted(map(re.escape, _PHRASE_TO_AGENT_B), key=len, reverse=True))
+)
+_TOKEN_RE_B = re.compile(rb"[a-z']+")
+
+# Tie-break when a query mentions several domains: memory beats task
+# beats calendar beats profile.
+_AGENT_PRIORITY: Dict[str, int] = {
+    "memory_keeper": 0,
+    "task_coordinator": 1,
+    "calendar_coordinator": 2,
+    "profile_manager": 3,
+}
+
+
+class AgentRouter:
+    """Keyword fast path plus embedding-based routing over the crew's agents."""
+
+    def __init__(self) -> None:
+        self._names: List[str] = list(ROUTE_REFERENCES)
+        self._centroids: Optional[np.ndarray] = None
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        # Imported lazily: the openai client is only needed once routing
+        # actually runs, and the crew module should stay cheap to import.
+        from openai import OpenAI
+
+        response = OpenAI().embeddings.create(model=EMBEDDING_MODEL, input=texts)
+        matrix = np.array([item.embedding for item in response.data], dtype=np.float32)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    def _ensure_centroids(self) -> np.ndarray:
+        if self._centroids is None:
+            flat = [ref for refs in ROUTE_REFERENCES.values() for ref in refs]
+            embedded = self._embed(flat)
+            centroids = []
+            offset = 0
+            for refs in ROUTE_REFERENCES.values():
+                chunk = embedded[offset : offset + len(refs)]
+                centroid = chunk.mean(axis=0)
+                centroids.append(centroid / np.linalg.norm(centroid))
+                offset += len(refs)
+            self._centroids = np.stack(centroids)
+        return self._centroids
+
+    @lru_cache(maxsize=1024)
+    def _embed_query(self, query: str) -> bytes:
+        # lru_cache needs a hashable, immutable return; store raw bytes.
+        return self._embed([query])[0].tobytes()
+
+    def embedding(self, query: str) -> np.ndarray:
+        """Return the (cached) normalized embedding for a query."""
+
+        return np.frombuffer(self._embed_query(query), dtype=np.float32)
+
+    def route(self, query: str) -> str:
+        """Return the best-matching agent name, or general on any failure."""
+
+        # One pass: collect every matching category, then pick by priority
+        # rather than by which keyword happened to appear first.
+        try:
+            lowered_b = query.encode("ascii").translate(_LOWER_TABLE)
+            matched = {
+                _WORD_TO_AGENT_B[token]
+                for token in _TOKEN_RE_B.findall(lowered_b)
+                if token in _WORD_TO_AGENT_B
+            }
+            matched.update(
+                _PHRASE_TO_AGENT_B[phrase] for phrase in _PHRASE_RE_B.findall(lowered_b)
+            )
+        except UnicodeEncodeError:
+            lowered = query.lower()
+            matched = {
+                _WORD_TO_AGENT[token]
+                for token in _TOKEN_RE.findall(lowered)
+                if token in _WORD_TO_AGENT
+            }
+            matched.update(
+                _PHRASE_TO_AGENT[phrase] for phrase in _PHRASE_RE.findall(lowered)
+            )
+        if matched:
+            return min(matched, key=_AGENT_PRIORITY.__getitem__)
+
+        try:
+            centroids = self._ensure_centroids()
+            vec = self.embedding(query)
+            return self._names[int(np.argmax(centroids @ vec))]
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Semantic routing failed, falling back to general: %s", exc)
+            return "general_assistant"
+
+    def route_and_embed(self, query: str, embed: bool = True) -> Tuple[str, Optional[np.ndarray]]:
+        """Route a query and also return its embedding, in one blocking call.
+
+        For callers that want the query vector as well (the semantic
+        reply cache): route()'s keyword fast path returns without ever
+        embedding, so the vector is not guaranteed to be cached — this
+        computes it on the same worker thread instead of leaving a
+        blocking embed call for the event loop. With ``embed=False``
+        only routing runs and the vector is None.
+        """
+        agent_name = self.route(query)
+        if not embed:
+            return agent_name, None
+        try:
+            return agent_name, self.embedding(query)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Query embedding unavailable: %s", exc)
+            return agent_name, None
+
+
+_router: Optional[AgentRouter] = None
+
+
+def get_router() -> AgentRouter:
+    """Return the singleton router instance."""
+
+    global _router  # noqa: PLW0603
+    if _router is None:
+        _router = AgentRouter()
+    return _router
+
+
+__all__ = ["AgentRouter", "ROUTE_REFERENCES", "get_router"]
@@ -2,12 +2,21 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
+import logging
+import operator
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Optional, Tuple
+
+import dateparser
 from crewai_tools import BaseTool
 from pydantic import BaseModel, Field
 
+from app.crew._loop import run_sync
+
 # Import utility functions
 from app.services.memory_utils import add_memory, search_memory, get_user_context
 from app.services.tasks import create_task, list_tasks, complete_task, delete_task
@@ -15,6 +24,112 @@ from app.integrations.calendar import get_calendar_service
 from app.services.calendar_auth import is_calendar_connected
 from app.integrations.calendar.google_calendar import GoogleCalendarProvider
 
+logger = logging.getLogger(__name__)
+
+
+def _tool_safe(label: str):
+    """Wrap a tool ``_run`` with the shared error path.
+
+    The full exception (with traceback) goes to the log; the LLM gets a
+    terse ``[tool-error:...]`` code instead of a multi-KB httpx/requests
+    repr that would be retokenized into the prompt on every retry.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("%s failed: %s", label, exc, exc_info=True)
+                return f"[tool-error:{label}:{type(exc).__name__}]"
+
+        return wrapper
+
+    return decorator
+
+
+class _ToolResultCache:
+    """Short-TTL LRU for read-tool results, keyed per user.
+
+    During a single turn the LLM often calls the same read tool twice to
+    double-check itself; a 30s window serves the repeat from memory
+    instead of a second backend round trip. Keys start with user_id so
+    writes can invalidate just that user's entries.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 4096) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: str) -> None:
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == user_id]
+            for key in stale:
+                del self._entries[key]
+
+
+_memory_cache = _ToolResultCache()
+_task_cache = _ToolResultCache()
+
+
+_DATEPARSER_SETTINGS = {"PREFER_DATES_FROM": "future"}
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime_cached(text: str, today: date) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return dateparser.parse(text, settings=_DATEPARSER_SETTINGS)
+
+
+def _parse_datetime(text: str) -> Optional[datetime]:
+    """Parse an ISO or natural-language date string, memoized per input.
+
+    fromisoformat is tried first as the cheap path; everything else
+    ("tomorrow at 2pm", "next friday") goes through dateparser. The
+    current date is part of the cache key so relative phrases cannot
+    serve yesterday's answer.
+    """
+
+    return _parse_datetime_cached(text, date.today())
+
+
+def _format_memories(memories: List[Any], bullet: str = "- ") -> str:
+    """Render memory rows as a bulleted list.
+
+    The result shape is checked once per response; well-formed rows then
+    go through a C-implemented map(itemgetter) instead of paying a
+    per-item ``.get`` fallback inside the comprehension.
+    """
+    if memories and isinstance(memories[0], dict) and "memory" in memories[0]:
+        texts = map(operator.itemgetter("memory"), memories)
+    else:
+        texts = map(str, memories)
+    return "\n".join(f"{bullet}{text}" for text in texts)
+
 
 # ============================================
 # Memory Tools (Mem0 Integration)
@@ -40,18 +155,23 @@ class MemorySearchTool(BaseTool):
     Examples: 'What does the user like?', 'What are user's dietary preferences?'"""
     args_schema: type[BaseModel] = MemorySearchInput
 
+    @_tool_safe("search_user_memory")
     def _run(self, query: str, user_id: str, limit: int = 5) -> str:
         """Search user memory synchronously."""
-        try:
-            result = asyncio.run(search_memory(query, user_id, k=limit))
-
-            if result.get("results"):
-                memories = result["results"]
-                formatted = "\n".join([f"- {mem.get('memory', mem)}" for mem in memories[:limit]])
-                return f"Found {len(memories)} relevant memories:\n{formatted}"
-            return "No relevant memories found."
-        except Exception as exc:
-            return f"Error searching memory: {exc}"
+        cache_key = (user_id, query.lower(), limit)
+        cached = _memory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = run_sync(search_memory(query, user_id, k=limit))
+
+        if result.get("results"):
+            memories = result["results"]
+            formatted = _format_memories(memories[:limit])
+            reply = f"Found {len(memories)} relevant memories:\n{formatted}"
+        else:
+            reply = "No relevant memories found."
+        _memory_cache.put(cache_key, reply)
+        return reply
 
 
 class MemoryAddTool(BaseTool):
@@ -61,13 +181,12 @@ class MemoryAddTool(BaseTool):
     Examples: 'User loves Italian food', 'User prefers morning meetings', 'User's birthday is March 15'"""
     args_schema: type[BaseModel] = MemoryAddInput
 
+    @_tool_safe("add_to_user_memory")
     def _run(self, text: str, user_id: str) -> str:
         """Add to user memory synchronously."""
-        try:
-            result = asyncio.run(add_memory(text, user_id))
-            return f"✓ Remembered: {text}"
-        except Exception as exc:
-            return f"Error saving memory: {exc}"
+        run_sync(add_memory(text, user_id))
+        _memory_cache.invalidate_user(user_id)
+        return f"✓ Remembered: {text}"
 
 
 class MemoryContextTool(BaseTool):
@@ -80,18 +199,16 @@ class MemoryContextTool(BaseTool):
 
     args_schema: type[BaseModel] = ContextInput
 
+    @_tool_safe("get_user_context")
     def _run(self, user_id: str) -> str:
         """Get user context synchronously."""
-        try:
-            result = asyncio.run(get_user_context(user_id))
+        result = run_sync(get_user_context(user_id))
 
-            if result.get("results"):
-                memories = result["results"]
-                formatted = "\n".join([f"- {mem.get('memory', mem)}" for mem in memories])
-                return f"User context ({len(memories)} items):\n{formatted}"
-            return "No stored context found for this user."
-        except Exception as exc:
-            return f"Error getting context: {exc}"
+        if result.get("results"):
+            memories = result["results"]
+            formatted = _format_memories(memories)
+            return f"User context ({len(memories)} items):\n{formatted}"
+        return "No stored context found for this user."
 
 
 # ============================================
@@ -132,35 +249,23 @@ class TaskCreateTool(BaseTool):
     Examples: 'Remind me to call mom tomorrow', 'Add task to review report by Friday'"""
     args_schema: type[BaseModel] = TaskCreateInput
 
+    @_tool_safe("create_task")
     def _run(self, user_id: str, title: str, details: Optional[str] = None,
              due_at: Optional[str] = None, recurrence: Optional[str] = None) -> str:
         """Create task synchronously."""
-        try:
-            # Parse due_at if provided
-            due_datetime = None
-            if due_at:
-                try:
-                    due_datetime = datetime.fromisoformat(due_at)
-                except:
-                    # Try parsing natural language dates
-                    if "tomorrow" in due_at.lower():
-                        due_datetime = datetime.now() + timedelta(days=1)
-                    elif "today" in due_at.lower():
-                        due_datetime = datetime.now()
-                    elif "next week" in due_at.lower():
-                        due_datetime = datetime.now() + timedelta(days=7)
-
-            result = asyncio.run(create_task(user_id, title, details, due_datetime, recurrence))
-
-            response = f"✓ Task created: {result['title']}"
-            if result.get('due_at'):
-                response += f" (due: {result['due_at']})"
-            if result.get('recurrence'):
-                response += f" [Recurs: {result['recurrence']}]"
-
-            return response
-        except Exception as exc:
-            return f"Error creating task: {exc}"
+        # Parse due_at if provided (ISO or natural language)
+        due_datetime = _parse_datetime(due_at) if due_at else None
+
+        result = run_sync(create_task(user_id, title, details, due_datetime, recurrence))
+        _task_cache.invalidate_user(user_id)
+
+        response = f"✓ Task created: {result['title']}"
+        if result.get('due_at'):
+            response += f" (due: {result['due_at']})"
+        if result.get('recurrence'):
+            response += f" [Recurs: {result['recurrence']}]"
+
+        return response
 
 
 class TaskListTool(BaseTool):
@@ -169,14 +274,18 @@ class TaskListTool(BaseTool):
     Use this to show what tasks the user has, or to check their todo list."""
     args_schema: type[BaseModel] = TaskListInput
 
+    @_tool_safe("list_tasks")
     def _run(self, user_id: str, limit: int = 10) -> str:
         """List tasks synchronously."""
-        try:
-            tasks = asyncio.run(list_tasks(user_id, limit))
-
-            if not tasks:
-                return "You have no pending tasks."
-
+        cache_key = (user_id, limit)
+        cached = _task_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        tasks = run_sync(list_tasks(user_id, limit))
+
+        if not tasks:
+            reply = "You have no pending tasks."
+        else:
             formatted = []
             for task in tasks:
                 line = f"• {task['title']}"
@@ -184,10 +293,9 @@ class TaskListTool(BaseTool):
                     line += f" (due: {task['due_at']})"
                 line += f" [ID: {task['id'][:8]}...]"
                 formatted.append(line)
-
-            return f"Your tasks ({len(tasks)}):\n" + "\n".join(formatted)
-        except Exception as exc:
-            return f"Error listing tasks: {exc}"
+            reply = f"Your tasks ({len(tasks)}):\n" + "\n".join(formatted)
+        _task_cache.put(cache_key, reply)
+        return reply
 
 
 class TaskCompleteTool(BaseTool):
@@ -196,15 +304,14 @@ class TaskCompleteTool(BaseTool):
     Use this when user says they finished a task or want to mark it done."""
     args_schema: type[BaseModel] = TaskCompleteInput
 
+    @_tool_safe("complete_task")
     def _run(self, task_id: str, user_id: str) -> str:
         """Complete task synchronously."""
-        try:
-            result = asyncio.run(complete_task(task_id, user_id))
-            if result:
-                return f"✓ Completed task: {result['title']}"
-            return "Task not found."
-        except Exception as exc:
-            return f"Error completing task: {exc}"
+        result = run_sync(complete_task(task_id, user_id))
+        _task_cache.invalidate_user(user_id)
+        if result:
+            return f"✓ Completed task: {result['title']}"
+        return "Task not found."
 
 
 class TaskDeleteTool(BaseTool):
@@ -213,15 +320,14 @@ class TaskDeleteTool(BaseTool):
     Use this when user wants to remove a task completely."""
     args_schema: type[BaseModel] = TaskDeleteInput
 
+    @_tool_safe("delete_task")
     def _run(self, task_id: str, user_id: str) -> str:
         """Delete task synchronously."""
-        try:
-            deleted = asyncio.run(delete_task(task_id, user_id))
-            if deleted:
-                return "✓ Task deleted"
-            return "Task not found."
-        except Exception as exc:
-            return f"Error deleting task: {exc}"
+        deleted = run_sync(delete_task(task_id, user_id))
+        _task_cache.invalidate_user(user_id)
+        if deleted:
+            return "✓ Task deleted"
+        return "Task not found."
 
 
 # ============================================
@@ -257,37 +363,35 @@ class CalendarListEventsTool(BaseTool):
     Searches across Google Calendar, Outlook, and Apple Calendar."""
     args_schema: type[BaseModel] = CalendarListEventsInput
 
+    @_tool_safe("list_calendar_events")
     def _run(self, user_id: str, days_ahead: int = 1) -> str:
         """List calendar events synchronously."""
-        try:
-            calendar = get_calendar_service(user_id=user_id)
+        calendar = get_calendar_service(user_id=user_id)
 
-            start = datetime.now()
-            end = start + timedelta(days=days_ahead)
+        start = datetime.now()
+        end = start + timedelta(days=days_ahead)
 
-            events = asyncio.run(calendar.list_events(start=start, end=end, max_results=10))
+        events = run_sync(calendar.list_events(start=start, end=end, max_results=10))
 
-            if not events:
-                period = "today" if days_ahead == 1 else f"the next {days_ahead} days"
-                return f"No events scheduled for {period}."
+        if not events:
+            period = "today" if days_ahead == 1 else f"the next {days_ahead} days"
+            return f"No events scheduled for {period}."
 
-            formatted = []
-            for event in events:
-                title = event.get("title", "Untitled")
-                start_time = event.get("start", "")
-                provider = event.get("provider", "")
+        formatted = []
+        for event in events:
+            title = event.title or "Untitled"
+            start_time = event.start or ""
+            provider = event.provider
 
-                try:
-                    start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                    time_str = start_dt.strftime("%b %d at %I:%M %p")
-                except:
-                    time_str = start_time
+            try:
+                start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                time_str = start_dt.strftime("%b %d at %I:%M %p")
+            except:
+                time_str = start_time
 
-                formatted.append(f"• {title} - {time_str} ({provider})")
+            formatted.append(f"• {title} - {time_str} ({provider})")
 
-            return f"Upcoming events ({len(events)}):\n" + "\n".join(formatted)
-        except Exception as exc:
-            return f"Error listing calendar events: {exc}"
+        return f"Upcoming events ({len(events)}):\n" + "\n".join(formatted)
 
 
 class CalendarCreateEventTool(BaseTool):
@@ -297,71 +401,54 @@ class CalendarCreateEventTool(BaseTool):
     Works with Google Calendar, Outlook, and Apple Calendar."""
     args_schema: type[BaseModel] = CalendarCreateEventInput
 
+    @_tool_safe("create_calendar_event")
     def _run(self, user_id: str, title: str, start_time: str,
              duration_hours: int = 1, description: Optional[str] = None,
              location: Optional[str] = None) -> str:
         """Create calendar event synchronously."""
-        try:
-            # Check if Google Calendar is connected
-            is_connected = asyncio.run(is_calendar_connected(user_id, "google"))
-
-            if not is_connected:
-                # Generate OAuth URL for the user to connect
-                try:
-                    google_calendar = GoogleCalendarProvider(user_id=user_id)
-                    auth_url = google_calendar.get_authorization_url()
-
-                    return (
-                        f"📅 To create calendar events, please connect your Google Calendar first!\n\n"
-                        f"Click this link to connect:\n{auth_url}\n\n"
-                        f"After connecting, I'll be able to create '{title}' and other events for you."
-                    )
-                except Exception as e:
-                    return (
-                        f"📅 Google Calendar is not connected. "
-                        f"Please ask the user to connect their calendar at /calendar/connect/google?user_id={user_id}"
-                    )
-
-            # Calendar is connected, proceed with creating event
-            calendar = get_calendar_service(user_id=user_id)
-
-            # Parse start time
-            start_dt = None
+        # Check if Google Calendar is connected
+        is_connected = run_sync(is_calendar_connected(user_id, "google"))
+
+        if not is_connected:
+            # Generate OAuth URL for the user to connect
             try:
-                start_dt = datetime.fromisoformat(start_time)
-            except:
-                # Natural language parsing
-                start_time_lower = start_time.lower()
-                now = datetime.now()
-
-                if "tomorrow" in start_time_lower:
-                    start_dt = now + timedelta(days=1)
-                    start_dt = start_dt.replace(hour=9, minute=0, second=0, microsecond=0)
-                elif "today" in start_time_lower:
-                    start_dt = now.replace(hour=9, minute=0, second=0, microsecond=0)
-                elif "next week" in start_time_lower:
-                    start_dt = now + timedelta(days=7)
-                    start_dt = start_dt.replace(hour=9, minute=0, second=0, microsecond=0)
-                else:
-                    start_dt = now + timedelta(hours=1)
-
-            end_dt = start_dt + timedelta(hours=duration_hours)
-
-            event = asyncio.run(calendar.create_event(
-                title=title,
-                start=start_dt,
-                end=end_dt,
-                description=description,
-                location=location
-            ))
-
-            if event:
-                time_str = start_dt.strftime("%b %d at %I:%M %p")
-                return f"✓ Created event: {title} on {time_str}"
+                google_calendar = GoogleCalendarProvider(user_id=user_id)
+                auth_url = google_calendar.get_authorization_url()
+
+                return (
+                    f"📅 To create calendar events, please connect your Google Calendar first!\n\n"
+                    f"Click this link to connect:\n{auth_url}\n\n"
+                    f"After connecting, I'll be able to create '{title}' and other events for you."
+                )
+            except Exception as e:
+                return (
+                    f"📅 Google Calendar is not connected. "
+                    f"Please ask the user to connect their calendar at /calendar/connect/google?user_id={user_id}"
+                )
+
+        # Calendar is connected, proceed with creating event
+        calendar = get_calendar_service(user_id=user_id)
+
+        # Parse start time (ISO or natural language)
+        start_dt = _parse_datetime(start_time)
+        if start_dt is None:
+            start_dt = datetime.now() + timedelta(hours=1)
+
+        end_dt = start_dt + timedelta(hours=duration_hours)
+
+        event = run_sync(calendar.create_event(
+            title=title,
+            start=start_dt,
+            end=end_dt,
+            description=description,
+            location=location
+        ))
 
-            return "Failed to create event. Please try again."
-        except Exception as exc:
-            return f"Error creating calendar event: {exc}"
+        if event:
+            time_str = start_dt.strftime("%b %d at %I:%M %p")
+            return f"✓ Created event: {title} on {time_str}"
+
+        return "Failed to create event. Please try again."
 
 
 class CalendarSearchEventsTool(BaseTool):
@@ -370,53 +457,143 @@ class CalendarSearchEventsTool(BaseTool):
     Use this to find events by name, description, or other criteria."""
     args_schema: type[BaseModel] = CalendarSearchEventsInput
 
+    @_tool_safe("search_calendar_events")
     def _run(self, user_id: str, query: str) -> str:
         """Search calendar events synchronously."""
-        try:
-            calendar = get_calendar_service(user_id=user_id)
-            events = asyncio.run(calendar.search_events(query, max_results=5))
+        calendar = get_calendar_service(user_id=user_id)
+        events = run_sync(calendar.search_events(query, max_results=5))
 
-            if not events:
-                return f"No events found matching '{query}'."
+        if not events:
+            return f"No events found matching '{query}'."
+
+        formatted = []
+        for event in events:
+            title = event.title or "Untitled"
+            start_time = event.start or ""
+            formatted.append(f"• {title} - {start_time}")
+
+        return f"Found {len(events)} event(s):\n" + "\n".join(formatted)
 
-            formatted = []
-            for event in events:
-                title = event.get("title", "Untitled")
-                start_time = event.get("start", "")
-                formatted.append(f"• {title} - {start_time}")
 
-            return f"Found {len(events)} event(s):\n" + "\n".join(formatted)
-        except Exception as exc:
-            return f"Error searching calendar: {exc}"
+# ============================================
+# Composite Tools
+# ============================================
+
+class CompositeContextInput(BaseModel):
+    """Input schema for the composite context fetch."""
+    user_id: str = Field(..., description="User ID")
+    query: str = Field(..., description="The user's request, used to search memories")
+
+
+class CompositeContextTool(BaseTool):
+    name: str = "get_full_user_context"
+    description: str = """Fetch the user's relevant memories, pending tasks, AND upcoming calendar events in ONE call.
+    Prefer this over separate memory/task/calendar lookups when a request spans multiple domains.
+    Example: 'what's on my schedule and remind me what I told you about Alice'"""
+    args_schema: type[BaseModel] = CompositeContextInput
+
+    # Bound the fan-out so one tool call can't overload the backends
+    _semaphore = asyncio.Semaphore(5)
+
+    async def _arun(self, user_id: str, query: str) -> str:
+        """Fetch memories, tasks, and events concurrently."""
+
+        async def bounded(coro):
+            async with CompositeContextTool._semaphore:
+                return await coro
+
+        calendar = get_calendar_service(user_id=user_id)
+        start = datetime.now()
+        end = start + timedelta(days=7)
+
+        # The three lookups are independent; overlap them so the call
+        # takes as long as the slowest backend, not the sum of all three.
+        memories, tasks, events = await asyncio.gather(
+            bounded(search_memory(query, user_id, k=5)),
+            bounded(list_tasks(user_id, 10)),
+            bounded(calendar.list_events(start=start, end=end, max_results=10)),
+            return_exceptions=True,
+        )
+
+        sections = []
+
+        if isinstance(memories, Exception):
+            sections.append(f"Memories unavailable: {memories}")
+        elif memories.get("results"):
+            sections.append(f"Relevant memories:\n{_format_memories(memories['results'])}")
+        else:
+            sections.append("No relevant memories found.")
+
+        if isinstance(tasks, Exception):
+            sections.append(f"Tasks unavailable: {tasks}")
+        elif tasks:
+            lines = "\n".join(f"• {task['title']}" for task in tasks)
+            sections.append(f"Pending tasks ({len(tasks)}):\n{lines}")
+        else:
+            sections.append("No pending tasks.")
+
+        if isinstance(events, Exception):
+            sections.append(f"Calendar unavailable: {events}")
+        elif events:
+            lines = "\n".join(
+                f"• {event.title or 'Untitled'} - {event.start or ''}"
+                for event in events
+            )
+            sections.append(f"Upcoming events ({len(events)}):\n{lines}")
+        else:
+            sections.append("No upcoming events this week.")
+
+        return "\n\n".join(sections)
+
+    @_tool_safe("get_full_user_context")
+    def _run(self, user_id: str, query: str) -> str:
+        """Fetch combined context synchronously."""
+        return run_sync(self._arun(user_id, query))
 
 
 # ============================================
 # Export all tools
 # ============================================
 
-def get_all_tools() -> List[BaseTool]:
-    """Get all CrewAI tools for Jenny."""
-    return [
-        # Memory tools
-        MemorySearchTool(),
-        MemoryAddTool(),
-        MemoryContextTool(),
+# Tools are stateless, so every caller can share one instance of each.
+# Memoized with maxsize=1 and returned as tuples: the sets are fixed for
+# the process lifetime and the immutable return keeps callers from
+# mutating the shared collection.
+
+@lru_cache(maxsize=1)
+def get_memory_tools() -> Tuple[BaseTool, ...]:
+    """Get the memory-management tools."""
+    return (MemorySearchTool(), MemoryAddTool(), MemoryContextTool())
+
 
-        # Task tools
-        TaskCreateTool(),
-        TaskListTool(),
-        TaskCompleteTool(),
-        TaskDeleteTool(),
+@lru_cache(maxsize=1)
+def get_task_tools() -> Tuple[BaseTool, ...]:
+    """Get the task-management tools."""
+    return (TaskCreateTool(), TaskListTool(), TaskCompleteTool(), TaskDeleteTool())
 
-        # Calendar tools
-        CalendarListEventsTool(),
-        CalendarCreateEventTool(),
-        CalendarSearchEventsTool(),
-    ]
+
+@lru_cache(maxsize=1)
+def get_calendar_tools() -> Tuple[BaseTool, ...]:
+    """Get the calendar tools."""
+    return (CalendarListEventsTool(), CalendarCreateEventTool(), CalendarSearchEventsTool())
+
+
+@lru_cache(maxsize=1)
+def get_all_tools() -> Tuple[BaseTool, ...]:
+    """Get all CrewAI tools for Jenny."""
+    return (
+        *get_memory_tools(),
+        *get_task_tools(),
+        *get_calendar_tools(),
+        CompositeContextTool(),
+    )
 
 
 __all__ = [
     "get_all_tools",
+    "get_memory_tools",
+    "get_task_tools",
+    "get_calendar_tools",
     "MemorySearchTool",
     "MemoryAddTool",
     "MemoryContextTool",
@@ -427,4 +604,5 @@ __all__ = [
     "CalendarListEventsTool",
     "CalendarCreateEventTool",
     "CalendarSearchEventsTool",
+    "CompositeContextTool",
 ]
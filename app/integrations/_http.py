@@ -0,0 +1,62 @@
+"""Shared outbound HTTP clients for integration backends.
+
+Mem0 and the calendar providers each talked to their APIs through
+ad-hoc clients (or bare module-level httpx calls), paying a TCP+TLS
+handshake per request. These singletons keep one keep-alive pool per
+process, with HTTP/2 enabled so independent requests to the same host
+multiplex over a single TLS session.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import httpx
+
+_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=256)
+_TIMEOUT = 10.0
+
+_sync_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+
+def get_sync_client() -> httpx.Client:
+    """Return the shared synchronous client."""
+
+    global _sync_client  # noqa: PLW0603
+    if _sync_client is None:
+        with _client_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(
+                    http2=True, limits=_LIMITS, timeout=_TIMEOUT
+                )
+    return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared asynchronous client."""
+
+    global _async_client  # noqa: PLW0603
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                _async_client = httpx.AsyncClient(
+                    http2=True, limits=_LIMITS, timeout=_TIMEOUT
+                )
+    return _async_client
+
+
+async def close_clients() -> None:
+    """Close the shared clients (lifespan shutdown)."""
+
+    global _sync_client, _async_client  # noqa: PLW0603
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+__all__ = ["get_sync_client", "get_async_client", "close_clients"]
@@ -7,6 +7,10 @@ Provides unified interface for:
 - Apple Calendar (CalDAV)
 """
 
-from app.integrations.calendar.unified import UnifiedCalendar, get_calendar_service
+from app.integrations.calendar.unified import (
+    UnifiedCalendar,
+    get_calendar_service,
+    invalidate_calendar_service,
+)
 
-__all__ = ["UnifiedCalendar", "get_calendar_service"]
+__all__ = ["UnifiedCalendar", "get_calendar_service", "invalidate_calendar_service"]
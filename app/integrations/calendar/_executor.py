@@ -0,0 +1,32 @@
+"""Shared worker pool for the blocking calendar SDKs.
+
+googleapiclient and caldav are synchronous: called inline from the
+providers' async methods they block the event loop for a full HTTPS
+round trip. Routing every SDK call through one bounded pool keeps the
+loop free and lets callers overlap provider requests with
+asyncio.gather, while capping how many threads calendar traffic can
+consume.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CALENDAR_POOL_SIZE", "16")),
+    thread_name_prefix="calendar",
+)
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking callable on the calendar pool and await its result."""
+
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, functools.partial(fn, *args, **kwargs)
+    )
+
+
+__all__ = ["run_blocking"]
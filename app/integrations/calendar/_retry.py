@@ -0,0 +1,130 @@
+"""Retry budget and backoff for rate-limited calendar providers.
+
+iCloud and Google both throttle with 429/503. The providers' blanket
+``except Exception: return []`` handlers silently drop those responses
+and the next call re-attempts immediately, which amplifies the very
+overload the server is signalling. ``_with_retry`` re-issues only
+rate-limit failures, honours ``Retry-After`` when the server sends one,
+backs off with decorrelated jitter otherwise, and draws from a
+token-bucket budget on the provider instance so a hard throttle can't
+turn into an unbounded retry storm across concurrent calls.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUSES = (429, 503)
+
+
+class _RetryBudget:
+    """Token bucket capping how many retries one provider may spend.
+
+    Refills continuously at ``refill_per_second``; each retry takes one
+    token. When the bucket is empty the original error propagates, so
+    sustained throttling degrades to the providers' normal failure path
+    instead of piling sleeps behind an overloaded server.
+    """
+
+    def __init__(self, capacity: float = 10.0, refill_per_second: float = 0.5):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def take(self) -> bool:
+        """Consume one token; return False when the budget is spent."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.refill_per_second,
+        )
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+def _status_of(exc: BaseException) -> Optional[int]:
+    """Best-effort HTTP status from googleapiclient, requests, or caldav errors."""
+    # googleapiclient.errors.HttpError carries an httplib2 Response as .resp
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    if status is None:
+        # requests.HTTPError (and caldav errors wrapping one) carry .response
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    try:
+        return int(status)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after_of(exc: BaseException) -> Optional[float]:
+    """Extract a Retry-After value in seconds, if the server sent one."""
+    value = None
+    resp = getattr(exc, "resp", None)
+    if resp is not None:
+        # httplib2's Response is a dict with lower-cased header keys
+        try:
+            value = resp.get("retry-after")
+        except AttributeError:
+            value = None
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if headers is not None:
+            value = headers.get("Retry-After")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        # HTTP-date form (rare) is not worth parsing; fall back to backoff
+        return None
+
+
+def _with_retry(max_attempts: int = 5, base: float = 0.5) -> Callable[..., Any]:
+    """Retry an async method on 429/503 with jittered exponential backoff.
+
+    Only rate-limit statuses are retried; everything else propagates to
+    the caller's existing error handling. If the wrapped method's
+    instance has a ``_retry_budget``, each retry must win a token from
+    it first.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            budget = getattr(args[0], "_retry_budget", None) if args else None
+            for attempt in range(max_attempts):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as exc:
+                    status = _status_of(exc)
+                    if status not in _RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                        raise
+                    if budget is not None and not budget.take():
+                        logger.warning("Retry budget exhausted; propagating %s", status)
+                        raise
+                    delay = base * (2 ** attempt) * random.uniform(0.5, 1.5)
+                    retry_after = _retry_after_of(exc)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                    logger.warning(
+                        "Rate limited (%s); retrying in %.1fs (attempt %d/%d)",
+                        status,
+                        delay,
+                        attempt + 1,
+                        max_attempts - 1,
+                    )
+                    await asyncio.sleep(delay)
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["_RetryBudget", "_with_retry"]
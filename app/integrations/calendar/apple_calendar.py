@@ -21,26 +21,93 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
+from app.core.cache import delete_value, get_value, set_value
+from app.integrations.calendar._executor import run_blocking
+from app.integrations.calendar._retry import _RetryBudget, _with_retry
 from app.integrations.calendar.base import CalendarEvent
 
 logger = logging.getLogger(__name__)
 
+# Discovered calendar URLs are cached per Apple ID for a week: rebuilding
+# them from the URL skips the principal + calendar-enumeration PROPFIND
+# round trips on every reconnect.
+_CALENDAR_URL_CACHE_TTL = 7 * 24 * 3600
+
+# Repeated get_event calls for the same uid within a short window
+# (month-view rendering, agent loops) are served from a per-provider
+# LRU instead of re-issuing the REPORT.
+_EVENT_CACHE_TTL = 30.0
+_EVENT_CACHE_SIZE = 1024
+
+# Fast-path VEVENT parsing: one multiline regex pass over the raw ical
+# text instead of a full icalendar parse, which profiles as the dominant
+# CPU cost on large listings. Only the fields _convert needs are pulled.
+_VEVENT_PROP_RE = re.compile(
+    r"^(SUMMARY|DESCRIPTION|DTSTART|DTEND|LOCATION|ATTENDEE|ORGANIZER)"
+    r"(?:;[^:\r\n]*)?:(.*)$",
+    re.MULTILINE,
+)
+_VALARM_RE = re.compile(r"BEGIN:VALARM.*?END:VALARM", re.DOTALL)
+
+
+def _parse_ical_dt(value: str) -> Tuple[Optional[datetime], bool]:
+    """Parse an ical date-time value; returns (datetime, is_all_day)."""
+    value = value.strip()
+    try:
+        if value.endswith("Z"):
+            return (
+                datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc),
+                False,
+            )
+        if "T" in value:
+            return datetime.strptime(value, "%Y%m%dT%H%M%S"), False
+        return datetime.strptime(value, "%Y%m%d"), True
+    except ValueError:
+        return None, False
+
+
+def _unescape_ical(value: str) -> str:
+    return value.replace("\\n", "\n").replace("\\,", ",").replace("\\;", ";")
+
+
 # Flag for CalDAV availability
 CALDAV_AVAILABLE = False
 
 try:
     import caldav
     from caldav.elements import dav, cdav
+    from requests.adapters import HTTPAdapter
 
     CALDAV_AVAILABLE = True
     logger.info("CalDAV library loaded successfully")
 except ImportError:
     logger.warning("CalDAV not available. Install with: pip install caldav")
 
+# Optional native VEVENT parser (Rust, built out-of-tree with maturin).
+# When installed it handles every component — including the RRULE/TZID
+# forms the regex fast path refuses — without touching icalendar's
+# Python-level transformToNative. Absent, the regex + icalendar paths
+# below serve everything.
+JENNY_ICAL_AVAILABLE = False
+
+try:
+    import jenny_ical
+
+    JENNY_ICAL_AVAILABLE = True
+    logger.info("jenny_ical native parser loaded")
+except ImportError:
+    jenny_ical = None
+
 
 class AppleCalendarProvider:
     """Apple Calendar (iCloud) provider using CalDAV."""
@@ -63,6 +130,30 @@ class AppleCalendarProvider:
         self.client = None
         self.principal = None
         self.calendar = None
+        self.calendars: List[Any] = []
+        # Shared across all this instance's calls so retries under
+        # iCloud throttling stay bounded
+        self._retry_budget = _RetryBudget()
+        # get_event TTL-LRU; entries drop on update/delete
+        self._event_cache: "OrderedDict[str, Tuple[float, CalendarEvent]]" = OrderedDict()
+
+    def _cache_event(self, event_id: str, event: CalendarEvent) -> None:
+        self._event_cache[event_id] = (time.monotonic() + _EVENT_CACHE_TTL, event)
+        self._event_cache.move_to_end(event_id)
+        while len(self._event_cache) > _EVENT_CACHE_SIZE:
+            self._event_cache.popitem(last=False)
+
+    def _cached_event(self, event_id: str) -> Optional[CalendarEvent]:
+        entry = self._event_cache.get(event_id)
+        if entry and entry[0] > time.monotonic():
+            self._event_cache.move_to_end(event_id)
+            return entry[1]
+        return None
+
+    @_with_retry(max_attempts=5)
+    async def _dav(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run a caldav call on the calendar pool, retrying 429 throttling."""
+        return await run_blocking(fn, *args, **kwargs)
 
     async def connect(self) -> bool:
         """
@@ -87,14 +178,30 @@ class AppleCalendarProvider:
                 password=self.app_password,
             )
 
+            # Mount a pooled adapter on the client's requests session so
+            # the PROPFIND/REPORT traffic below reuses keep-alive
+            # connections instead of re-handshaking TLS per request.
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            self.client.session.mount("https://", adapter)
+
+            # Cached calendar URLs skip the principal and enumeration
+            # PROPFINDs; the objects rebuild directly from the URL.
+            if await self._connect_from_cache():
+                return True
+
             # Get principal
-            self.principal = self.client.principal()
+            self.principal = await self._dav(self.client.principal)
 
-            # Get default calendar
-            calendars = self.principal.calendars()
+            # Get all calendars; the first stays the default for writes
+            calendars = await self._dav(self.principal.calendars)
             if calendars:
-                self.calendar = calendars[0]  # Use first calendar
-                logger.info(f"Connected to Apple Calendar for user {self.user_id}")
+                self.calendars = list(calendars)
+                self.calendar = calendars[0]
+                await self._store_calendar_urls()
+                logger.info(
+                    f"Connected to Apple Calendar for user {self.user_id} "
+                    f"({len(calendars)} calendars)"
+                )
                 return True
             else:
                 logger.error("No calendars found")
@@ -104,39 +211,193 @@ class AppleCalendarProvider:
             logger.exception(f"Failed to connect to Apple Calendar: {exc}")
             return False
 
+    def _calendar_url_cache_key(self) -> str:
+        return f"caldav:calendars:{self.apple_id}"
+
+    async def _connect_from_cache(self) -> bool:
+        """Rebuild calendar objects from cached URLs, skipping discovery."""
+        try:
+            cached = await get_value(self._calendar_url_cache_key())
+        except Exception:  # noqa: BLE001 - Redis down; discovery still works
+            return False
+        if not cached:
+            return False
+
+        try:
+            urls = orjson.loads(cached)
+            self.calendars = [
+                caldav.Calendar(client=self.client, url=url) for url in urls
+            ]
+            self.calendar = self.calendars[0]
+            logger.info(
+                f"Connected to Apple Calendar for user {self.user_id} "
+                f"({len(urls)} calendars, cached URLs)"
+            )
+            return True
+        except Exception as exc:  # noqa: BLE001 - stale/bad cache entry
+            logger.warning("Cached CalDAV URLs unusable (%s); rediscovering", exc)
+            await self.invalidate_calendar_cache()
+            self.calendars = []
+            self.calendar = None
+            return False
+
+    async def _store_calendar_urls(self) -> None:
+        try:
+            urls = [str(calendar.url) for calendar in self.calendars]
+            await set_value(
+                self._calendar_url_cache_key(),
+                orjson.dumps(urls).decode(),
+                ttl=_CALENDAR_URL_CACHE_TTL,
+            )
+        except Exception:  # noqa: BLE001 - caching is best-effort
+            logger.debug("Could not cache CalDAV calendar URLs", exc_info=True)
+
+    async def invalidate_calendar_cache(self) -> None:
+        """Drop cached calendar URLs (e.g. after a 401/404 from the server)."""
+        try:
+            await delete_value(self._calendar_url_cache_key())
+        except Exception:  # noqa: BLE001
+            pass
+
     async def list_events(
         self,
         start: datetime,
         end: datetime,
         max_results: int = 100,
     ) -> List[CalendarEvent]:
-        """List events from Apple Calendar."""
+        """List events from all of the user's Apple calendars."""
         if not self.calendar:
             logger.error("Not connected to calendar")
             return []
 
         try:
-            events = self.calendar.date_search(
-                start=start,
-                end=end,
-                expand=True,
-            )
-
-            result = []
-            for event in events[:max_results]:
-                try:
-                    ical = event.icalendar_component
-                    result.append(self._convert_to_calendar_event(ical, event.id))
-                except Exception as exc:
-                    logger.warning(f"Failed to parse event: {exc}")
-                    continue
-
-            return result
+            # The window is walked in weekly shards so a broad query
+            # ("next year") stops transferring and parsing events once
+            # max_results is reached, instead of pulling the full range
+            # and slicing in Python. Within each shard, one date_search
+            # per calendar fans out concurrently on the shared pool so
+            # the shard costs a single round trip.
+            result: List[CalendarEvent] = []
+            seen_ids = set()
+            window_start = start
+            while window_start < end and len(result) < max_results:
+                window_end = min(window_start + timedelta(days=7), end)
+                searches = await asyncio.gather(
+                    *[
+                        self._dav(
+                            calendar.date_search,
+                            start=window_start,
+                            end=window_end,
+                            expand=True,
+                        )
+                        for calendar in (self.calendars or [self.calendar])
+                    ],
+                    return_exceptions=True,
+                )
+
+                for events in searches:
+                    if isinstance(events, Exception):
+                        logger.warning(f"Calendar search failed: {events}")
+                        continue
+                    for event in events:
+                        converted = self._convert_object(event)
+                        # Events straddling a shard boundary show up in
+                        # both shards; keep the first occurrence only.
+                        if converted is not None and converted.id not in seen_ids:
+                            seen_ids.add(converted.id)
+                            result.append(converted)
+
+                window_start = window_end
+
+            result.sort(key=lambda event: event.start or "")
+            return result[:max_results]
 
         except Exception as exc:
             logger.exception(f"Failed to list Apple Calendar events: {exc}")
             return []
 
+    async def list_busy_windows(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> List[Tuple[str, str]]:
+        """Return busy (start, end) windows without fetching full events.
+
+        Uses a CalDAV free-busy REPORT, which the server answers with
+        interval boundaries only. Falls back to a date_search if the
+        server rejects the request (not all CalDAV servers support it).
+        """
+        if not self.calendar:
+            logger.error("Not connected to calendar")
+            return []
+
+        try:
+            freebusy = await self._dav(self.calendar.freebusy_request, start, end)
+
+            windows: List[Tuple[str, str]] = []
+            for component in freebusy.icalendar_instance.walk("VFREEBUSY"):
+                periods = component.get("FREEBUSY")
+                if periods is None:
+                    continue
+                if not isinstance(periods, list):
+                    periods = [periods]
+                for entry in periods:
+                    for period in getattr(entry, "dts", [entry]):
+                        value = getattr(period, "dt", period)
+                        if not (isinstance(value, tuple) and len(value) == 2):
+                            continue
+                        window_start, window_end = value
+                        # Periods may come in duration form
+                        if isinstance(window_end, timedelta):
+                            window_end = window_start + window_end
+                        windows.append((window_start.isoformat(), window_end.isoformat()))
+            windows.sort()
+            return windows
+
+        except Exception as exc:
+            logger.warning(
+                "Free-busy REPORT failed (%s); falling back to date_search", exc
+            )
+            events = await self.list_events(start, end)
+            return [
+                (event.start, event.end)
+                for event in events
+                if event.start and event.end
+            ]
+
+    async def _list_headers(self, start: datetime, end: datetime) -> List[Tuple[str, str]]:
+        """Fetch only (uid, summary) pairs for events in the window.
+
+        The REPORT restricts calendar-data to SUMMARY/DTSTART/UID, so
+        each event comes back as a few hundred bytes instead of its full
+        VCALENDAR body. Used by search paths that only need titles to
+        decide which events are worth fetching in full.
+        """
+        searches = await asyncio.gather(
+            *[
+                self._dav(
+                    calendar.search,
+                    start=start,
+                    end=end,
+                    event=True,
+                    expand=True,
+                    props=["summary", "dtstart", "uid"],
+                )
+                for calendar in (self.calendars or [self.calendar])
+            ]
+        )
+
+        headers = []
+        for events in searches:
+            for event in events:
+                try:
+                    summary = str(event.icalendar_component.get("SUMMARY", ""))
+                    headers.append((str(event.id), summary))
+                except Exception as exc:
+                    logger.warning(f"Failed to parse event header: {exc}")
+                    continue
+        return headers
+
     async def create_event(
         self,
         title: str,
@@ -183,7 +444,7 @@ class AppleCalendarProvider:
             cal.add_component(event)
 
             # Save to CalDAV server
-            created_event = self.calendar.save_event(cal.to_ical())
+            created_event = await self._dav(self.calendar.save_event, cal.to_ical())
 
             logger.info(f"Created Apple Calendar event: {created_event.id}")
 
@@ -212,7 +473,7 @@ class AppleCalendarProvider:
 
         try:
             # Get the event
-            event = self.calendar.event_by_uid(event_id)
+            event = await self._dav(self.calendar.event_by_uid, event_id)
             ical = event.icalendar_component
 
             # Update fields
@@ -228,9 +489,10 @@ class AppleCalendarProvider:
                 ical["LOCATION"] = location
 
             # Save updated event
-            event.save()
+            await self._dav(event.save)
 
             logger.info(f"Updated Apple Calendar event: {event_id}")
+            self._event_cache.pop(event_id, None)
             return self._convert_to_calendar_event(ical, event_id)
 
         except Exception as exc:
@@ -244,10 +506,11 @@ class AppleCalendarProvider:
             return False
 
         try:
-            event = self.calendar.event_by_uid(event_id)
-            event.delete()
+            event = await self._dav(self.calendar.event_by_uid, event_id)
+            await self._dav(event.delete)
 
             logger.info(f"Deleted Apple Calendar event: {event_id}")
+            self._event_cache.pop(event_id, None)
             return True
 
         except Exception as exc:
@@ -256,14 +519,20 @@ class AppleCalendarProvider:
 
     async def get_event(self, event_id: str) -> Optional[CalendarEvent]:
         """Get a specific Apple Calendar event."""
+        cached = self._cached_event(event_id)
+        if cached is not None:
+            return cached
+
         if not self.calendar:
             logger.error("Not connected to calendar")
             return None
 
         try:
-            event = self.calendar.event_by_uid(event_id)
+            event = await self._dav(self.calendar.event_by_uid, event_id)
             ical = event.icalendar_component
-            return self._convert_to_calendar_event(ical, event_id)
+            converted = self._convert_to_calendar_event(ical, event_id, include_raw=True)
+            self._cache_event(event_id, converted)
+            return converted
 
         except Exception as exc:
             logger.exception(f"Failed to get Apple Calendar event: {exc}")
@@ -279,14 +548,60 @@ class AppleCalendarProvider:
         """
         Search Apple Calendar events.
 
-        Note: CalDAV doesn't support text search natively,
-        so we fetch events in the time range and filter by query.
+        Prefers a server-side calendar-query with a text match on
+        SUMMARY, so only matching VEVENTs are transferred and parsed.
+        Servers that reject the REPORT fall back to fetching the time
+        range and filtering title/description locally.
         """
         if not start:
             start = datetime.now()
         if not end:
             end = start + timedelta(days=365)  # Search 1 year ahead
 
+        if self.calendar:
+            searches = await asyncio.gather(
+                *[
+                    self._dav(
+                        calendar.search,
+                        start=start,
+                        end=end,
+                        event=True,
+                        expand=True,
+                        summary=query,
+                    )
+                    for calendar in (self.calendars or [self.calendar])
+                ],
+                return_exceptions=True,
+            )
+            matches = [
+                events for events in searches if not isinstance(events, Exception)
+            ]
+            if matches:
+                result = []
+                for events in matches:
+                    for event in events:
+                        converted = self._convert_object(event)
+                        if converted is not None:
+                            result.append(converted)
+                result.sort(key=lambda event: event.start or "")
+                return result[:max_results]
+            logger.warning("Server-side text search unsupported; filtering locally")
+
+            # Second-best path: pull headers only (uid + summary), match
+            # titles locally, and fetch full bodies just for the hits.
+            try:
+                headers = await self._list_headers(start, end)
+                query_lower = query.lower()
+                matched_ids = [
+                    uid for uid, summary in headers if query_lower in summary.lower()
+                ][:max_results]
+                matched = await asyncio.gather(
+                    *[self.get_event(uid) for uid in matched_ids]
+                )
+                return [event for event in matched if event]
+            except Exception as exc:  # noqa: BLE001 - partial REPORT unsupported too
+                logger.warning(f"Header-only search failed ({exc}); full fetch")
+
         all_events = await self.list_events(start, end, max_results=max_results * 2)
 
         # Filter by query (simple text matching)
@@ -294,8 +609,8 @@ class AppleCalendarProvider:
         filtered = []
 
         for event in all_events:
-            title = event.get("title", "").lower()
-            description = event.get("description", "").lower()
+            title = event.title.lower()
+            description = event.description.lower()
 
             if query_lower in title or query_lower in description:
                 filtered.append(event)
@@ -305,8 +620,118 @@ class AppleCalendarProvider:
 
         return filtered
 
-    def _convert_to_calendar_event(self, ical_event: Any, event_id: str) -> CalendarEvent:
-        """Convert iCalendar event to standard CalendarEvent format."""
+    def _convert_object(self, event: Any, include_raw: bool = False) -> Optional[CalendarEvent]:
+        """Convert a caldav object, preferring the native then regex fast paths."""
+        try:
+            data = getattr(event, "data", None)
+            if JENNY_ICAL_AVAILABLE and isinstance(data, str):
+                native = self._convert_native(data, str(event.id), include_raw=include_raw)
+                if native is not None:
+                    return native
+            if isinstance(data, str):
+                fast = self._convert_from_raw(data, str(event.id), include_raw=include_raw)
+                if fast is not None:
+                    return fast
+            return self._convert_to_calendar_event(
+                event.icalendar_component, event.id, include_raw=include_raw
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to parse event: {exc}")
+            return None
+
+    def _convert_native(
+        self, data: str, event_id: str, include_raw: bool = False
+    ) -> Optional[CalendarEvent]:
+        """Parse VEVENT text with the jenny_ical native extension.
+
+        Returns None when the extension can't parse the component, so
+        the caller falls through to the regex/icalendar paths.
+        """
+        try:
+            fields = jenny_ical.parse_vevent(data.encode())
+        except Exception:  # noqa: BLE001 - any parse failure falls through
+            return None
+        if not fields:
+            return None
+
+        return CalendarEvent(
+            id=event_id,
+            title=fields.get("summary", ""),
+            description=fields.get("description", ""),
+            start=fields.get("dtstart"),
+            end=fields.get("dtend"),
+            location=fields.get("location", ""),
+            attendees=list(fields.get("attendees", [])),
+            organizer=fields.get("organizer", ""),
+            all_day=bool(fields.get("all_day", False)),
+            provider="apple",
+            raw=data if include_raw else None,
+        )
+
+    def _convert_from_raw(
+        self, data: str, event_id: str, include_raw: bool = False
+    ) -> Optional[CalendarEvent]:
+        """Extract the fields we need straight from raw VEVENT text.
+
+        Returns None for components this parser does not handle —
+        recurrence rules and TZID-localised times — which the caller
+        then converts through icalendar instead.
+        """
+        if "RRULE" in data or "TZID=" in data:
+            return None
+
+        # Unfold continuation lines, isolate the VEVENT, and strip
+        # alarms (their DESCRIPTION would shadow the event's).
+        unfolded = data.replace("\r\n ", "").replace("\r\n\t", "").replace("\n ", "")
+        begin = unfolded.find("BEGIN:VEVENT")
+        end_marker = unfolded.find("END:VEVENT")
+        if begin == -1 or end_marker == -1:
+            return None
+        block = _VALARM_RE.sub("", unfolded[begin:end_marker])
+
+        props: Dict[str, List[str]] = {}
+        for match in _VEVENT_PROP_RE.finditer(block):
+            props.setdefault(match.group(1), []).append(match.group(2).strip())
+
+        start = end = None
+        all_day = False
+        start_value = props.get("DTSTART", [""])[0]
+        if start_value:
+            start, all_day = _parse_ical_dt(start_value)
+            if start is None:
+                return None
+        end_value = props.get("DTEND", [""])[0]
+        if end_value:
+            end, _ = _parse_ical_dt(end_value)
+            if end is None:
+                return None
+
+        return CalendarEvent(
+            id=event_id,
+            title=_unescape_ical(props.get("SUMMARY", [""])[0]),
+            description=_unescape_ical(props.get("DESCRIPTION", [""])[0]),
+            start=start.isoformat() if start else None,
+            end=end.isoformat() if end else None,
+            location=_unescape_ical(props.get("LOCATION", [""])[0]),
+            attendees=[
+                attendee.replace("mailto:", "")
+                for attendee in props.get("ATTENDEE", [])
+            ],
+            organizer=props.get("ORGANIZER", [""])[0].replace("mailto:", ""),
+            all_day=all_day,
+            provider="apple",
+            raw=data if include_raw else None,
+        )
+
+    def _convert_to_calendar_event(
+        self, ical_event: Any, event_id: str, include_raw: bool = False
+    ) -> CalendarEvent:
+        """Convert iCalendar event to standard CalendarEvent format.
+
+        The parsed icalendar component is only attached as ``raw`` when
+        ``include_raw`` is set; list and search paths drop it so bulk
+        results don't pin a component tree per event.
+        """
         try:
             start = ical_event.get("DTSTART").dt if ical_event.get("DTSTART") else None
             end = ical_event.get("DTEND").dt if ical_event.get("DTEND") else None
@@ -324,24 +749,22 @@ class AppleCalendarProvider:
                     attendees.append(email)
 
             return CalendarEvent(
-                {
-                    "id": event_id,
-                    "title": str(ical_event.get("SUMMARY", "")),
-                    "description": str(ical_event.get("DESCRIPTION", "")),
-                    "start": start.isoformat() if start else None,
-                    "end": end.isoformat() if end else None,
-                    "location": str(ical_event.get("LOCATION", "")),
-                    "attendees": attendees,
-                    "organizer": str(ical_event.get("ORGANIZER", "")).replace("mailto:", ""),
-                    "all_day": not hasattr(start, "hour") if start else False,
-                    "provider": "apple",
-                    "raw": ical_event,
-                }
+                id=event_id,
+                title=str(ical_event.get("SUMMARY", "")),
+                description=str(ical_event.get("DESCRIPTION", "")),
+                start=start.isoformat() if start else None,
+                end=end.isoformat() if end else None,
+                location=str(ical_event.get("LOCATION", "")),
+                attendees=attendees,
+                organizer=str(ical_event.get("ORGANIZER", "")).replace("mailto:", ""),
+                all_day=not hasattr(start, "hour") if start else False,
+                provider="apple",
+                raw=ical_event if include_raw else None,
             )
 
         except Exception as exc:
             logger.exception(f"Failed to convert iCalendar event: {exc}")
-            return CalendarEvent({"id": event_id, "title": "Unknown", "provider": "apple"})
+            return CalendarEvent(id=event_id, title="Unknown", provider="apple")
 
 
 __all__ = ["AppleCalendarProvider"]
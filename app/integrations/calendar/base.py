@@ -6,29 +6,45 @@ This module defines the interface that all calendar providers must implement.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, List, Optional, Protocol
 
 
-class CalendarEvent(Dict[str, Any]):
+@dataclass(slots=True)
+class CalendarEvent:
     """
-    Dictionary representing a calendar event.
+    A calendar event normalised across providers.
 
-    Common fields:
+    ``slots=True`` fixes the attribute set at class level, so each
+    event carries no per-instance ``__dict__`` — listing a busy week
+    across three providers allocates hundreds of these.
+
+    Fields:
         - id: Unique event identifier
         - title: Event title/summary
         - description: Event description
-        - start: Start datetime
-        - end: End datetime
+        - start: Start time as an ISO 8601 string
+        - end: End time as an ISO 8601 string
         - location: Event location
         - attendees: List of attendee emails
         - organizer: Organizer email
         - all_day: Boolean indicating all-day event
-        - recurrence: Recurrence rules (optional)
-        - reminder_minutes: Minutes before event to remind (optional)
+        - provider: Name of the provider the event came from
+        - raw: Provider-native payload, when the caller asked for it
     """
 
-    pass
+    id: Optional[str] = None
+    title: str = ""
+    description: str = ""
+    start: Optional[str] = None
+    end: Optional[str] = None
+    location: str = ""
+    attendees: List[str] = field(default_factory=list)
+    organizer: str = ""
+    all_day: bool = False
+    provider: str = ""
+    raw: Any = None
 
 
 class CalendarProvider(Protocol):
@@ -22,13 +22,20 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
+from app.integrations.calendar._executor import run_blocking
+from app.integrations.calendar._retry import _RetryBudget, _with_retry
 from app.integrations.calendar.base import CalendarEvent
 
 logger = logging.getLogger(__name__)
@@ -46,10 +53,12 @@ SCOPES = ["https://www.googleapis.com/auth/calendar"]
 GOOGLE_CALENDAR_AVAILABLE = False
 
 try:
+    import httplib2
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
     from google_auth_oauthlib.flow import Flow
-    from googleapiclient.discovery import build
+    from googleapiclient.discovery import build, build_from_document
 
     GOOGLE_CALENDAR_AVAILABLE = True
     logger.info("Google Calendar API library loaded successfully")
@@ -60,9 +69,246 @@ except ImportError:
     )
 
 
+# Decode API responses with orjson: googleapiclient runs json.loads on
+# every response body, and busy accounts return multi-MB event listings.
+# Only deserialization is swapped — serialization stays on stdlib json,
+# since orjson.dumps returns bytes where the client expects str.
+if GOOGLE_CALENDAR_AVAILABLE:
+    try:
+        import orjson
+        from googleapiclient.model import JsonModel
+
+        def _orjson_deserialize(self: Any, content: Any) -> Any:
+            body = orjson.loads(content)
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+        JsonModel.deserialize = _orjson_deserialize
+    except ImportError:
+        # orjson missing: stdlib json decoding stays in place
+        pass
+
+
+# Static discovery document: build() normally downloads and parses a
+# ~200KB JSON from the discovery endpoint for every authenticated
+# provider. When the doc is shipped next to this module (or pointed to
+# by GOOGLE_CALENDAR_DISCOVERY_DOC), the service is built from it
+# locally — no discovery round trip, one parse per process.
+_DISCOVERY_PATH = os.getenv(
+    "GOOGLE_CALENDAR_DISCOVERY_DOC",
+    os.path.join(os.path.dirname(__file__), "calendar_v3.json"),
+)
+
+
+# Partial-response masks: the API omits everything the converter never
+# reads (~20 of the ~30 fields per event), cutting list payloads by
+# half or more. The sync variant keeps status (cancellation handling)
+# and nextSyncToken alongside the paging token.
+_EVENT_FIELDS = (
+    "items(id,summary,description,start,end,location,"
+    "attendees/email,organizer/email,recurrence),nextPageToken"
+)
+_SYNC_EVENT_FIELDS = (
+    "items(id,status,summary,description,start,end,location,"
+    "attendees/email,organizer/email,recurrence),nextPageToken,nextSyncToken"
+)
+_SINGLE_EVENT_FIELDS = (
+    "id,summary,description,start,end,location,"
+    "attendees/email,organizer/email,recurrence"
+)
+
+# Repeated get_event calls for the same id (month-view rendering, agent
+# loops re-reading an event they just mentioned) are served from a short
+# per-provider LRU instead of hitting the network again.
+_EVENT_CACHE_TTL = 30.0
+_EVENT_CACHE_SIZE = 1024
+
+
+class _SyncState:
+    """One user's syncToken, event map, and the prime's lower bound."""
+
+    __slots__ = ("token", "events", "floor")
+
+    def __init__(self) -> None:
+        self.token: Optional[str] = None
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self.floor: Optional[datetime] = None
+
+
+# Incremental sync state, keyed by user and shared across provider
+# instances: unified.py expires instances every few minutes, and
+# without shared state each new instance would re-prime its event map
+# from scratch — more traffic than the windowed calls sync replaces.
+_SYNC_STATE_SIZE = 1024
+_sync_states: "OrderedDict[str, _SyncState]" = OrderedDict()
+
+
+def _sync_state_for(user_id: str) -> _SyncState:
+    state = _sync_states.get(user_id)
+    if state is None:
+        state = _SyncState()
+        _sync_states[user_id] = state
+    _sync_states.move_to_end(user_id)
+    while len(_sync_states) > _SYNC_STATE_SIZE:
+        _sync_states.popitem(last=False)
+    return state
+
+
+@lru_cache(maxsize=1)
+def _client_config() -> Dict[str, Any]:
+    """OAuth client config shared by every Flow this module builds."""
+    return {
+        "web": {
+            "client_id": GOOGLE_CLIENT_ID,
+            "client_secret": GOOGLE_CLIENT_SECRET,
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+        }
+    }
+
+
+@lru_cache(maxsize=1)
+def _authorization_flow() -> "Flow":
+    """Shared Flow for building authorization URLs.
+
+    Flow.from_client_config validates the config and assembles the OAuth
+    session on every call; for URL generation the object is reused as-is.
+    Token exchange still constructs a fresh Flow per call, because
+    fetch_token stores the token on the flow's session and sharing that
+    across users would cross their credentials.
+    """
+    return Flow.from_client_config(
+        _client_config(), scopes=SCOPES, redirect_uri=GOOGLE_REDIRECT_URI
+    )
+
+
+def _to_rfc3339_utc(dt: datetime) -> str:
+    """Format a datetime as the RFC 3339 UTC form the API expects.
+
+    ``isoformat() + "Z"`` silently mislabels tz-aware non-UTC datetimes
+    as UTC; aware values are converted first, naive ones are taken as
+    UTC (the provider's existing convention).
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache(maxsize=1)
+def _load_discovery_doc() -> Optional[str]:
+    try:
+        with open(_DISCOVERY_PATH, encoding="utf-8") as doc:
+            return doc.read()
+    except OSError:
+        logger.info("No local discovery doc at %s; using discovery endpoint", _DISCOVERY_PATH)
+        return None
+
+
+class _AsyncBatcher:
+    """Coalesce concurrent API requests into one BatchHttpRequest.
+
+    When several coroutines fetch events in the same tick (fan-outs,
+    bursts of tool calls), each request would otherwise go out as its
+    own HTTPS call. Enqueued requests are collected for a few
+    milliseconds and flushed as a single multipart batch, amortizing
+    the HTTP overhead across the burst. A lone request skips the batch
+    envelope entirely, so the quiet path costs nothing extra.
+    """
+
+    # How long the worker waits for more requests to join a batch
+    MAX_WAIT = 0.01
+    # Idle period after which the worker exits (restarted on demand) so
+    # it doesn't pin an expired provider instance forever
+    IDLE_TIMEOUT = 30.0
+
+    def __init__(self, provider: "GoogleCalendarProvider"):
+        self._provider = provider
+        self._queue: "asyncio.Queue[Tuple[Any, asyncio.Future]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def enqueue(self, request: Any) -> Any:
+        """Submit a request and await its (possibly batched) response."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._worker())
+        return await future
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=self.IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                return
+            ops = await self._drain(first)
+            await self._flush(ops)
+
+    async def _drain(
+        self, first: Tuple[Any, asyncio.Future]
+    ) -> List[Tuple[Any, asyncio.Future]]:
+        """Collect requests for up to MAX_WAIT, capped at the batch limit."""
+        ops = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.MAX_WAIT
+        while len(ops) < GoogleCalendarProvider.BATCH_LIMIT:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                ops.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return ops
+
+    async def _flush(self, ops: List[Tuple[Any, asyncio.Future]]) -> None:
+        if len(ops) == 1:
+            request, future = ops[0]
+            try:
+                result = await self._provider._execute(request)
+            except Exception as exc:  # noqa: BLE001 - forwarded to the caller
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            return
+
+        # Callbacks run inside batch.execute on the pool thread; collect
+        # there and resolve the futures back on the event loop.
+        results: Dict[str, Tuple[Any, Any]] = {}
+
+        def _collect(request_id: str, response: Any, exception: Any) -> None:
+            results[request_id] = (response, exception)
+
+        batch = self._provider.service.new_batch_http_request(callback=_collect)
+        for index, (request, _) in enumerate(ops):
+            batch.add(request, request_id=str(index))
+
+        try:
+            await self._provider._execute(batch)
+        except Exception as exc:  # noqa: BLE001 - whole batch failed
+            for _, future in ops:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for index, (_, future) in enumerate(ops):
+            response, exception = results.get(str(index), (None, None))
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(response)
+
+
 class GoogleCalendarProvider:
     """Google Calendar provider implementation."""
 
+    # Google caps batched requests at 50 operations per call
+    BATCH_LIMIT = 50
+
     def __init__(self, user_id: str):
         """
         Initialize Google Calendar provider.
@@ -73,6 +319,35 @@ class GoogleCalendarProvider:
         self.user_id = user_id
         self.service = None
         self.credentials = None
+        # Per-thread AuthorizedHttp instances; see _authorized_http
+        self._local = threading.local()
+        # Incremental sync state: event map maintained via syncToken
+        # deltas instead of re-fetching the whole window per call
+        self._sync = _sync_state_for(user_id)
+        # One restore attempt per instance; instances are short-lived
+        # (UnifiedCalendar's TTL cache), so a failed load retries with
+        # the next instance rather than per call
+        self._load_attempted = False
+        # Shared across all this instance's calls so retries under a
+        # sustained rate limit stay bounded
+        self._retry_budget = _RetryBudget()
+        # Coalesces concurrent single-event requests into batch calls
+        self._batcher = _AsyncBatcher(self)
+        # get_event TTL-LRU; entries drop on update/delete
+        self._event_cache: "OrderedDict[str, Tuple[float, CalendarEvent]]" = OrderedDict()
+
+    def _cache_event(self, event_id: str, event: CalendarEvent) -> None:
+        self._event_cache[event_id] = (time.monotonic() + _EVENT_CACHE_TTL, event)
+        self._event_cache.move_to_end(event_id)
+        while len(self._event_cache) > _EVENT_CACHE_SIZE:
+            self._event_cache.popitem(last=False)
+
+    def _cached_event(self, event_id: str) -> Optional[CalendarEvent]:
+        entry = self._event_cache.get(event_id)
+        if entry and entry[0] > time.monotonic():
+            self._event_cache.move_to_end(event_id)
+            return entry[1]
+        return None
 
     def get_authorization_url(self) -> str:
         """
@@ -84,18 +359,7 @@ class GoogleCalendarProvider:
         if not GOOGLE_CALENDAR_AVAILABLE:
             raise RuntimeError("Google Calendar API not available")
 
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": GOOGLE_CLIENT_ID,
-                    "client_secret": GOOGLE_CLIENT_SECRET,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                }
-            },
-            scopes=SCOPES,
-            redirect_uri=GOOGLE_REDIRECT_URI,
-        )
+        flow = _authorization_flow()
 
         authorization_url, state = flow.authorization_url(
             access_type="offline",
@@ -118,27 +382,15 @@ class GoogleCalendarProvider:
             raise RuntimeError("Google Calendar API not available")
 
         try:
+            # Fresh Flow per exchange: fetch_token stores the resulting
+            # token on the flow's session, so this one can't be shared.
             flow = Flow.from_client_config(
-                {
-                    "web": {
-                        "client_id": GOOGLE_CLIENT_ID,
-                        "client_secret": GOOGLE_CLIENT_SECRET,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                    }
-                },
-                scopes=SCOPES,
-                redirect_uri=GOOGLE_REDIRECT_URI,
+                _client_config(), scopes=SCOPES, redirect_uri=GOOGLE_REDIRECT_URI
             )
 
-            flow.fetch_token(code=auth_code)
+            await run_blocking(flow.fetch_token, code=auth_code)
             self.credentials = flow.credentials
-
-            # Build the service
-            self.service = build("calendar", "v3", credentials=self.credentials)
-
-            # TODO: Store credentials securely for this user
-            # For now, credentials are only in memory
+            await self._build_service()
 
             logger.info(f"Google Calendar authenticated for user {self.user_id}")
             return True
@@ -147,6 +399,122 @@ class GoogleCalendarProvider:
             logger.exception(f"Failed to authenticate Google Calendar: {exc}")
             return False
 
+    async def _build_service(self) -> None:
+        """Build the API service.
+
+        The service's default transport is never used directly: every
+        call goes through ``_execute``, which supplies the calling
+        thread's own persistent connection from ``_authorized_http``.
+        """
+        discovery_doc = _load_discovery_doc()
+        if discovery_doc is not None:
+            # Local doc: no network, no run_blocking needed
+            self.service = build_from_document(discovery_doc, credentials=self.credentials)
+        else:
+            self.service = await run_blocking(
+                build, "calendar", "v3", credentials=self.credentials, cache_discovery=False
+            )
+
+    def _authorized_http(self) -> Any:
+        """Authorized transport owned by the current pool thread.
+
+        httplib2.Http is not thread-safe, and ``_execute`` dispatches
+        onto the shared calendar pool, so one provider-wide connection
+        could see interleaved writes from overlapping calls (gathered
+        list calls, a batch flush racing a direct request). Each pool
+        thread keeps its own AuthorizedHttp instead: TLS sessions are
+        still reused call-to-call, just per thread rather than per
+        provider. Rebuilt when the credentials object is replaced by
+        re-auth or a restore.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None or http.credentials is not self.credentials:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    async def load_credentials(self) -> bool:
+        """Restore this user's persisted credentials, refreshing if stale.
+
+        Lets a restarted process resume API access straight from the
+        token store instead of sending every user back through the OAuth
+        consent round. An expired access token with a refresh token is
+        refreshed here and the new token written back, so the store
+        stays current between runs of the background refresh job.
+        """
+        if not GOOGLE_CALENDAR_AVAILABLE:
+            return False
+
+        from app.services.calendar_auth import get_calendar_token, save_calendar_token
+
+        row = await get_calendar_token(self.user_id, "google")
+        if not row:
+            return False
+
+        token_data = row.get("token_data") or {}
+        expiry = None
+        if row.get("token_expiry"):
+            try:
+                parsed = datetime.fromisoformat(row["token_expiry"])
+                if parsed.tzinfo is not None:
+                    # google.oauth2 expects a naive UTC expiry
+                    parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+                expiry = parsed
+            except ValueError:
+                expiry = None
+
+        try:
+            self.credentials = Credentials(
+                token=row["access_token"],
+                refresh_token=row.get("refresh_token"),
+                token_uri=token_data.get("token_uri", "https://oauth2.googleapis.com/token"),
+                client_id=GOOGLE_CLIENT_ID,
+                client_secret=GOOGLE_CLIENT_SECRET,
+                scopes=token_data.get("scopes") or SCOPES,
+                expiry=expiry,
+            )
+
+            if self.credentials.expired and self.credentials.refresh_token:
+                await run_blocking(self.credentials.refresh, Request())
+                await save_calendar_token(
+                    user_id=self.user_id,
+                    provider="google",
+                    access_token=self.credentials.token,
+                    refresh_token=self.credentials.refresh_token or row.get("refresh_token"),
+                    token_expiry=self.credentials.expiry,
+                    token_data={
+                        "scopes": self.credentials.scopes,
+                        "token_uri": self.credentials.token_uri,
+                    },
+                )
+
+            await self._build_service()
+            logger.info(f"Restored Google Calendar credentials for user {self.user_id}")
+            return True
+
+        except Exception as exc:
+            logger.warning(f"Could not restore Google credentials: {exc}")
+            self.credentials = None
+            return False
+
+    async def _ensure_service(self) -> bool:
+        """Return True once the service is usable, restoring it if needed."""
+        if self.service:
+            return True
+        if self._load_attempted:
+            return False
+        self._load_attempted = True
+        return await self.load_credentials()
+
+    @_with_retry(max_attempts=5)
+    async def _execute(self, request: Any) -> Any:
+        """Run an API request on the calendar pool, retrying rate limits."""
+        return await run_blocking(self._execute_blocking, request)
+
+    def _execute_blocking(self, request: Any) -> Any:
+        """Execute on the pool thread with that thread's own transport."""
+        return request.execute(http=self._authorized_http())
+
     async def list_events(
         self,
         start: datetime,
@@ -154,23 +522,36 @@ class GoogleCalendarProvider:
         max_results: int = 100,
     ) -> List[CalendarEvent]:
         """List events from Google Calendar."""
-        if not self.service:
+        if not await self._ensure_service():
             logger.error("Google Calendar service not initialized")
             return []
 
+        # Incremental sync first: after the initial prime, each call
+        # transfers only the deltas since the last poll (usually an
+        # empty page) instead of re-fetching the whole window. The map
+        # only covers events from the prime's lower bound onward, so
+        # windows reaching further back fall through to the windowed
+        # query below.
+        window_start = start.replace(tzinfo=timezone.utc) if start.tzinfo is None else start
+        state = self._sync
+        if state.token is None or state.floor is None or window_start >= state.floor:
+            try:
+                if await self._sync_events(time_min=start):
+                    return self._events_in_window(start, end, max_results)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Incremental sync failed ({exc}); using windowed list")
+
         try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId="primary",
-                    timeMin=start.isoformat() + "Z",
-                    timeMax=end.isoformat() + "Z",
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
+            request = self.service.events().list(
+                calendarId="primary",
+                timeMin=_to_rfc3339_utc(start),
+                timeMax=_to_rfc3339_utc(end),
+                maxResults=max_results,
+                singleEvents=True,
+                orderBy="startTime",
+                fields=_EVENT_FIELDS,
             )
+            events_result = await self._execute(request)
 
             events = events_result.get("items", [])
 
@@ -180,6 +561,141 @@ class GoogleCalendarProvider:
             logger.exception(f"Failed to list Google Calendar events: {exc}")
             return []
 
+    async def _sync_events(self, time_min: datetime, _retry: bool = True) -> bool:
+        """Bring the per-user event map up to date via syncToken deltas.
+
+        The first call pages events from ``time_min`` onward (the bound
+        is carried forward by the sync token) and stores the
+        nextSyncToken; later calls pass the token and merge only what
+        changed since (cancelled events are dropped from the map). A 410
+        from the API means the token expired server-side, so the state
+        is cleared and the map re-primed once.
+        """
+        state = self._sync
+        if state.token is None:
+            state.events.clear()
+            state.floor = (
+                time_min.replace(tzinfo=timezone.utc) if time_min.tzinfo is None else time_min
+            )
+        page_token: Optional[str] = None
+        while True:
+            # syncToken cannot be combined with time filters or ordering
+            params: Dict[str, Any] = {
+                "calendarId": "primary",
+                "singleEvents": True,
+                "maxResults": 250,
+                "fields": _SYNC_EVENT_FIELDS,
+            }
+            if state.token:
+                params["syncToken"] = state.token
+            else:
+                # Bound the initial prime: without timeMin it would page
+                # the entire calendar history into the map
+                params["timeMin"] = _to_rfc3339_utc(time_min)
+            if page_token:
+                params["pageToken"] = page_token
+
+            try:
+                response = await self._execute(self.service.events().list(**params))
+            except Exception as exc:
+                if getattr(getattr(exc, "resp", None), "status", None) == 410 and _retry:
+                    logger.info("Google sync token expired; re-priming event map")
+                    state.token = None
+                    state.events.clear()
+                    return await self._sync_events(time_min, _retry=False)
+                raise
+
+            for event in response.get("items", []):
+                if event.get("status") == "cancelled":
+                    state.events.pop(event["id"], None)
+                else:
+                    state.events[event["id"]] = event
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                state.token = response.get("nextSyncToken")
+                # Without a token the server cannot serve deltas next
+                # time; report failure so callers use the windowed list.
+                return state.token is not None
+
+    @staticmethod
+    def _event_time(event: Dict[str, Any], field: str) -> Optional[datetime]:
+        data = event.get(field, {})
+        value = data.get("dateTime") or data.get("date")
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
+    def _events_in_window(
+        self, start: datetime, end: datetime, max_results: int
+    ) -> List[CalendarEvent]:
+        """Serve a window query from the synced event map."""
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+
+        selected = []
+        for event in self._sync.events.values():
+            event_start = self._event_time(event, "start")
+            if event_start is None:
+                continue
+            event_end = self._event_time(event, "end") or event_start
+            # Overlap test, matching the API's timeMin/timeMax semantics:
+            # an event that started before the window but is still in
+            # progress must appear in "what's on now" queries.
+            if event_end > start and event_start < end:
+                selected.append((event_start, event))
+        selected.sort(key=lambda pair: pair[0])
+        return [
+            self._convert_to_calendar_event(event)
+            for _, event in selected[:max_results]
+        ]
+
+    async def list_busy_windows(
+        self,
+        start: datetime,
+        end: datetime,
+        calendars: Optional[List[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """Return busy (start, end) windows without fetching full events.
+
+        Availability questions only need interval boundaries, so this
+        uses the FreeBusy endpoint: the response is a few bytes per busy
+        block instead of full event objects, and several calendars are
+        checked server-side in one call.
+        """
+        if not await self._ensure_service():
+            logger.error("Google Calendar service not initialized")
+            return []
+
+        try:
+            body = {
+                "timeMin": _to_rfc3339_utc(start),
+                "timeMax": _to_rfc3339_utc(end),
+                "items": [{"id": calendar_id} for calendar_id in (calendars or ["primary"])],
+            }
+            response = await self._execute(self.service.freebusy().query(body=body))
+
+            windows: List[Tuple[str, str]] = []
+            for calendar_data in response.get("calendars", {}).values():
+                windows.extend(
+                    (block["start"], block["end"])
+                    for block in calendar_data.get("busy", [])
+                )
+            windows.sort()
+            return windows
+
+        except Exception as exc:
+            logger.exception(f"Failed to query Google Calendar free/busy: {exc}")
+            return []
+
     async def create_event(
         self,
         title: str,
@@ -192,44 +708,25 @@ class GoogleCalendarProvider:
         all_day: bool = False,
     ) -> Optional[CalendarEvent]:
         """Create a new event in Google Calendar."""
-        if not self.service:
+        if not await self._ensure_service():
             logger.error("Google Calendar service not initialized")
             return None
 
         try:
-            event_body: Dict[str, Any] = {
-                "summary": title,
-                "start": {
-                    "dateTime": start.isoformat(),
-                    "timeZone": "UTC",
-                },
-                "end": {
-                    "dateTime": end.isoformat(),
-                    "timeZone": "UTC",
-                },
-            }
-
-            if description:
-                event_body["description"] = description
-
-            if location:
-                event_body["location"] = location
+            event_body = self._build_event_body(
+                title=title,
+                start=start,
+                end=end,
+                description=description,
+                location=location,
+                attendees=attendees,
+                reminder_minutes=reminder_minutes,
+            )
 
-            if attendees:
-                event_body["attendees"] = [{"email": email} for email in attendees]
-
-            if reminder_minutes is not None:
-                event_body["reminders"] = {
-                    "useDefault": False,
-                    "overrides": [
-                        {"method": "popup", "minutes": reminder_minutes},
-                    ],
-                }
-
-            created_event = (
-                self.service.events()
-                .insert(calendarId="primary", body=event_body)
-                .execute()
+            created_event = await self._execute(
+                self.service.events().insert(
+                    calendarId="primary", body=event_body, fields=_SINGLE_EVENT_FIELDS
+                )
             )
 
             logger.info(f"Created Google Calendar event: {created_event.get('id')}")
@@ -239,6 +736,104 @@ class GoogleCalendarProvider:
             logger.exception(f"Failed to create Google Calendar event: {exc}")
             return None
 
+    async def create_events_bulk(
+        self, events: List[Dict[str, Any]]
+    ) -> Dict[str, Optional[CalendarEvent]]:
+        """Create many events with batched HTTP requests.
+
+        Inserting N events one by one costs N HTTPS round trips. A
+        BatchHttpRequest packs up to 50 inserts (Google's batch limit)
+        into a single multipart call, so the wall time is roughly one
+        round trip per chunk of 50 instead of one per event.
+
+        Args:
+            events: List of dicts with create_event's keyword arguments
+                (title, start, end, and optionally description, location,
+                attendees, reminder_minutes)
+
+        Returns:
+            Dict keyed by the event's position as a string; values are
+            the created CalendarEvent, or None for entries that failed.
+        """
+        if not await self._ensure_service():
+            logger.error("Google Calendar service not initialized")
+            return {str(index): None for index in range(len(events))}
+
+        results: Dict[str, Optional[CalendarEvent]] = {}
+
+        def _collect(request_id: str, response: Any, exception: Any) -> None:
+            if exception is not None:
+                logger.warning("Batched event insert %s failed: %s", request_id, exception)
+                results[request_id] = None
+            else:
+                results[request_id] = self._convert_to_calendar_event(response)
+
+        try:
+            for offset in range(0, len(events), self.BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=_collect)
+                for index, spec in enumerate(
+                    events[offset : offset + self.BATCH_LIMIT], start=offset
+                ):
+                    body = self._build_event_body(**spec)
+                    batch.add(
+                        self.service.events().insert(calendarId="primary", body=body),
+                        request_id=str(index),
+                    )
+                await self._execute(batch)
+
+            logger.info(
+                "Created %d/%d Google Calendar events in bulk",
+                sum(1 for event in results.values() if event is not None),
+                len(events),
+            )
+            return results
+
+        except Exception as exc:
+            logger.exception(f"Failed to bulk-create Google Calendar events: {exc}")
+            return results
+
+    def _build_event_body(
+        self,
+        title: str,
+        start: datetime,
+        end: datetime,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        attendees: Optional[List[str]] = None,
+        reminder_minutes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Build the Google event resource body shared by insert paths."""
+        event_body: Dict[str, Any] = {
+            "summary": title,
+            "start": {
+                "dateTime": _to_rfc3339_utc(start),
+                "timeZone": "UTC",
+            },
+            "end": {
+                "dateTime": _to_rfc3339_utc(end),
+                "timeZone": "UTC",
+            },
+        }
+
+        if description:
+            event_body["description"] = description
+
+        if location:
+            event_body["location"] = location
+
+        if attendees:
+            event_body["attendees"] = [{"email": email} for email in attendees]
+
+        if reminder_minutes is not None:
+            event_body["reminders"] = {
+                "useDefault": False,
+                "overrides": [
+                    {"method": "popup", "minutes": reminder_minutes},
+                ],
+            }
+
+        return event_body
+
     async def update_event(
         self,
         event_id: str,
@@ -250,21 +845,23 @@ class GoogleCalendarProvider:
         attendees: Optional[List[str]] = None,
     ) -> Optional[CalendarEvent]:
         """Update an existing Google Calendar event."""
-        if not self.service:
+        if not await self._ensure_service():
             logger.error("Google Calendar service not initialized")
             return None
 
         try:
             # First, get the existing event
-            event = self.service.events().get(calendarId="primary", eventId=event_id).execute()
+            event = await self._execute(
+                self.service.events().get(calendarId="primary", eventId=event_id)
+            )
 
             # Update fields
             if title:
                 event["summary"] = title
             if start:
-                event["start"]["dateTime"] = start.isoformat()
+                event["start"]["dateTime"] = _to_rfc3339_utc(start)
             if end:
-                event["end"]["dateTime"] = end.isoformat()
+                event["end"]["dateTime"] = _to_rfc3339_utc(end)
             if description:
                 event["description"] = description
             if location:
@@ -273,13 +870,15 @@ class GoogleCalendarProvider:
                 event["attendees"] = [{"email": email} for email in attendees]
 
             # Update the event
-            updated_event = (
-                self.service.events()
-                .update(calendarId="primary", eventId=event_id, body=event)
-                .execute()
+            updated_event = await self._execute(
+                self.service.events().update(
+                    calendarId="primary", eventId=event_id, body=event,
+                    fields=_SINGLE_EVENT_FIELDS,
+                )
             )
 
             logger.info(f"Updated Google Calendar event: {event_id}")
+            self._event_cache.pop(event_id, None)
             return self._convert_to_calendar_event(updated_event)
 
         except Exception as exc:
@@ -288,13 +887,16 @@ class GoogleCalendarProvider:
 
     async def delete_event(self, event_id: str) -> bool:
         """Delete a Google Calendar event."""
-        if not self.service:
+        if not await self._ensure_service():
             logger.error("Google Calendar service not initialized")
             return False
 
         try:
-            self.service.events().delete(calendarId="primary", eventId=event_id).execute()
+            await self._execute(
+                self.service.events().delete(calendarId="primary", eventId=event_id)
+            )
             logger.info(f"Deleted Google Calendar event: {event_id}")
+            self._event_cache.pop(event_id, None)
             return True
 
         except Exception as exc:
@@ -303,13 +905,23 @@ class GoogleCalendarProvider:
 
     async def get_event(self, event_id: str) -> Optional[CalendarEvent]:
         """Get a specific Google Calendar event."""
-        if not self.service:
+        cached = self._cached_event(event_id)
+        if cached is not None:
+            return cached
+
+        if not await self._ensure_service():
             logger.error("Google Calendar service not initialized")
             return None
 
         try:
-            event = self.service.events().get(calendarId="primary", eventId=event_id).execute()
-            return self._convert_to_calendar_event(event)
+            event = await self._batcher.enqueue(
+                self.service.events().get(
+                    calendarId="primary", eventId=event_id, fields=_SINGLE_EVENT_FIELDS
+                )
+            )
+            converted = self._convert_to_calendar_event(event, include_raw=True)
+            self._cache_event(event_id, converted)
+            return converted
 
         except Exception as exc:
             logger.exception(f"Failed to get Google Calendar event: {exc}")
@@ -323,7 +935,7 @@ class GoogleCalendarProvider:
         max_results: int = 20,
     ) -> List[CalendarEvent]:
         """Search Google Calendar events."""
-        if not self.service:
+        if not await self._ensure_service():
             logger.error("Google Calendar service not initialized")
             return []
 
@@ -334,14 +946,15 @@ class GoogleCalendarProvider:
                 "maxResults": max_results,
                 "singleEvents": True,
                 "orderBy": "startTime",
+                "fields": _EVENT_FIELDS,
             }
 
             if start:
-                params["timeMin"] = start.isoformat() + "Z"
+                params["timeMin"] = _to_rfc3339_utc(start)
             if end:
-                params["timeMax"] = end.isoformat() + "Z"
+                params["timeMax"] = _to_rfc3339_utc(end)
 
-            events_result = self.service.events().list(**params).execute()
+            events_result = await self._execute(self.service.events().list(**params))
             events = events_result.get("items", [])
 
             return [self._convert_to_calendar_event(event) for event in events]
@@ -350,8 +963,15 @@ class GoogleCalendarProvider:
             logger.exception(f"Failed to search Google Calendar events: {exc}")
             return []
 
-    def _convert_to_calendar_event(self, google_event: Dict[str, Any]) -> CalendarEvent:
-        """Convert Google Calendar event to standard CalendarEvent format."""
+    def _convert_to_calendar_event(
+        self, google_event: Dict[str, Any], include_raw: bool = False
+    ) -> CalendarEvent:
+        """Convert Google Calendar event to standard CalendarEvent format.
+
+        The provider-native payload is only attached when ``include_raw``
+        is set; list and search results never need it, and keeping it
+        alive pins the full API response for every event returned.
+        """
         start_data = google_event.get("start", {})
         end_data = google_event.get("end", {})
 
@@ -360,21 +980,19 @@ class GoogleCalendarProvider:
         end_str = end_data.get("dateTime") or end_data.get("date")
 
         return CalendarEvent(
-            {
-                "id": google_event.get("id"),
-                "title": google_event.get("summary", ""),
-                "description": google_event.get("description", ""),
-                "start": start_str,
-                "end": end_str,
-                "location": google_event.get("location", ""),
-                "attendees": [
-                    attendee.get("email") for attendee in google_event.get("attendees", [])
-                ],
-                "organizer": google_event.get("organizer", {}).get("email"),
-                "all_day": "date" in start_data,
-                "provider": "google",
-                "raw": google_event,
-            }
+            id=google_event.get("id"),
+            title=google_event.get("summary", ""),
+            description=google_event.get("description", ""),
+            start=start_str,
+            end=end_str,
+            location=google_event.get("location", ""),
+            attendees=[
+                attendee.get("email") for attendee in google_event.get("attendees", [])
+            ],
+            organizer=google_event.get("organizer", {}).get("email") or "",
+            all_day="date" in start_data,
+            provider="google",
+            raw=google_event if include_raw else None,
         )
 
 
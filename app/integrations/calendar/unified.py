@@ -24,9 +24,14 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.integrations.calendar.apple_calendar import AppleCalendarProvider
 from app.integrations.calendar.base import CalendarEvent
@@ -52,13 +57,17 @@ class UnifiedCalendar:
             user_id: User identifier
         """
         self.user_id = user_id
-        self.providers: Dict[str, Any] = {}
         self.primary_provider: Optional[str] = None
 
-        # Initialize providers (will be connected when credentials are available)
-        self.providers["google"] = GoogleCalendarProvider(user_id=user_id)
-        self.providers["microsoft"] = MicrosoftCalendarProvider(user_id=user_id)
-        self.providers["apple"] = AppleCalendarProvider(user_id=user_id)
+        # Provider factories; instances are built on first use so that
+        # single-provider paths (e.g. create_event on the primary) don't
+        # pay for constructing the other two providers.
+        self.providers: Dict[str, Callable[[], Any]] = {
+            "google": lambda: GoogleCalendarProvider(user_id=user_id),
+            "microsoft": lambda: MicrosoftCalendarProvider(user_id=user_id),
+            "apple": lambda: AppleCalendarProvider(user_id=user_id),
+        }
+        self._instances: Dict[str, Any] = {}
 
     def set_primary_provider(self, provider_name: str) -> None:
         """
@@ -81,9 +90,14 @@ class UnifiedCalendar:
             provider_name: Name of provider (google, microsoft, apple)
 
         Returns:
-            Calendar provider instance or None
+            Calendar provider instance (created on first use) or None
         """
-        return self.providers.get(provider_name)
+        factory = self.providers.get(provider_name)
+        if factory is None:
+            return None
+        if provider_name not in self._instances:
+            self._instances[provider_name] = factory()
+        return self._instances[provider_name]
 
     async def list_all_events(
         self,
@@ -102,20 +116,30 @@ class UnifiedCalendar:
         Returns:
             Dictionary mapping provider names to event lists
         """
-        all_events: Dict[str, List[CalendarEvent]] = {}
-
-        for provider_name, provider in self.providers.items():
-            try:
-                events = await provider.list_events(
+        # The providers are independent network calls; running them
+        # concurrently makes the fan-out cost the slowest provider
+        # rather than the sum of all three.
+        names = list(self.providers)
+        results = await asyncio.gather(
+            *[
+                self.get_provider(name).list_events(
                     start=start,
                     end=end,
                     max_results=max_results_per_provider,
                 )
-                all_events[provider_name] = events
-                logger.debug(f"Retrieved {len(events)} events from {provider_name}")
-            except Exception as exc:
-                logger.warning(f"Failed to list events from {provider_name}: {exc}")
+                for name in names
+            ],
+            return_exceptions=True,
+        )
+
+        all_events: Dict[str, List[CalendarEvent]] = {}
+        for provider_name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to list events from {provider_name}: {result}")
                 all_events[provider_name] = []
+            else:
+                all_events[provider_name] = result
+                logger.debug(f"Retrieved {len(result)} events from {provider_name}")
 
         return all_events
 
@@ -152,7 +176,7 @@ class UnifiedCalendar:
             merged_events.extend(events)
 
         # Sort by start time
-        merged_events.sort(key=lambda e: e.get("start", ""))
+        merged_events.sort(key=lambda e: e.start or "")
 
         return merged_events[:max_results]
 
@@ -312,20 +336,26 @@ class UnifiedCalendar:
                 return await provider.search_events(query, start, end, max_results)
             return []
 
-        # Search across all providers
-        all_results = []
+        # Search across all providers concurrently
+        names = list(self.providers)
+        results = await asyncio.gather(
+            *[
+                self.get_provider(name).search_events(query, start, end, max_results)
+                for name in names
+            ],
+            return_exceptions=True,
+        )
 
-        for name, provider in self.providers.items():
-            try:
-                results = await provider.search_events(query, start, end, max_results)
-                all_results.extend(results)
-                logger.debug(f"Found {len(results)} events in {name}")
-            except Exception as exc:
-                logger.warning(f"Search failed in {name}: {exc}")
+        all_results = []
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Search failed in {name}: {result}")
                 continue
+            all_results.extend(result)
+            logger.debug(f"Found {len(result)} events in {name}")
 
         # Sort by relevance/start time
-        all_results.sort(key=lambda e: e.get("start", ""))
+        all_results.sort(key=lambda e: e.start or "")
 
         return all_results[:max_results]
 
@@ -336,36 +366,49 @@ class UnifiedCalendar:
         Returns:
             Dictionary with sync status for each provider
         """
-        sync_status = {}
-
-        for name, provider in self.providers.items():
-            try:
-                # Check if provider is connected by trying to list events
-                from datetime import timedelta
-
-                start = datetime.now()
-                end = start + timedelta(days=1)
-
-                events = await provider.list_events(start, end, max_results=1)
+        from datetime import timedelta
+
+        # Check connectivity by trying to list events, all providers
+        # concurrently
+        start = datetime.now()
+        end = start + timedelta(days=1)
+
+        names = list(self.providers)
+        results = await asyncio.gather(
+            *[
+                self.get_provider(name).list_events(start, end, max_results=1)
+                for name in names
+            ],
+            return_exceptions=True,
+        )
 
+        sync_status = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                sync_status[name] = {
+                    "connected": False,
+                    "error": str(result),
+                    "status": "error",
+                }
+            else:
                 sync_status[name] = {
                     "connected": True,
                     "last_sync": datetime.now().isoformat(),
                     "status": "ok",
                 }
 
-            except Exception as exc:
-                sync_status[name] = {
-                    "connected": False,
-                    "error": str(exc),
-                    "status": "error",
-                }
-
         return sync_status
 
 
-# Singleton instance per user
-_calendar_instances: Dict[str, UnifiedCalendar] = {}
+# Per-user instances, kept warm for a few minutes so repeated calendar
+# ops reuse the providers' HTTP clients and cached tokens, but bounded
+# and expiring so credential changes are picked up and memory stays flat.
+# A plain functools.lru_cache would give the same LRU bound but no TTL
+# and no per-user invalidation, both of which re-auth depends on.
+_CALENDAR_CACHE_TTL = 300.0
+_CALENDAR_CACHE_SIZE = int(os.getenv("CALENDAR_CACHE_SIZE", "1024"))
+_calendar_instances: "OrderedDict[str, tuple[float, UnifiedCalendar]]" = OrderedDict()
+_calendar_lock = threading.Lock()
 
 
 def get_calendar_service(user_id: str) -> UnifiedCalendar:
@@ -378,10 +421,27 @@ def get_calendar_service(user_id: str) -> UnifiedCalendar:
     Returns:
         UnifiedCalendar instance
     """
-    if user_id not in _calendar_instances:
-        _calendar_instances[user_id] = UnifiedCalendar(user_id=user_id)
+    now = time.monotonic()
+    with _calendar_lock:
+        entry = _calendar_instances.get(user_id)
+        if entry and entry[0] > now:
+            _calendar_instances.move_to_end(user_id)
+            return entry[1]
+
+    service = UnifiedCalendar(user_id=user_id)
+    with _calendar_lock:
+        _calendar_instances[user_id] = (now + _CALENDAR_CACHE_TTL, service)
+        _calendar_instances.move_to_end(user_id)
+        while len(_calendar_instances) > _CALENDAR_CACHE_SIZE:
+            _calendar_instances.popitem(last=False)
+    return service
+
+
+def invalidate_calendar_service(user_id: str) -> None:
+    """Drop a user's cached instance (e.g. after re-auth or a 401)."""
 
-    return _calendar_instances[user_id]
+    with _calendar_lock:
+        _calendar_instances.pop(user_id, None)
 
 
-__all__ = ["UnifiedCalendar", "get_calendar_service"]
+__all__ = ["UnifiedCalendar", "get_calendar_service", "invalidate_calendar_service"]
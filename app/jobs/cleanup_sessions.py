@@ -0,0 +1,71 @@
+"""Periodic cleanup of stale session keys in Redis."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.cache import get_client
+from app.core.config import get_settings
+from app.services.session import HISTORY_MAX_LENGTH
+
+logger = logging.getLogger(__name__)
+
+_cleanup_task: Optional[asyncio.Task] = None
+
+
+async def cleanup_sessions_once() -> int:
+    """Trim oversized histories and expire idle sessions.
+
+    Returns the number of session keys touched.
+    """
+
+    settings = get_settings()
+    touched = 0
+
+    try:
+        client = await get_client()
+        async for key in client.scan_iter(match="session:*"):
+            async with client.pipeline(transaction=False) as pipe:
+                if key.endswith(":history"):
+                    pipe.ltrim(key, -HISTORY_MAX_LENGTH, -1)
+                pipe.expire(key, settings.session_idle_ttl)
+                await pipe.execute()
+            touched += 1
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Session cleanup pass failed: %s", exc)
+
+    return touched
+
+
+async def _cleanup_loop() -> None:
+    settings = get_settings()
+    while True:
+        await asyncio.sleep(settings.session_cleanup_interval)
+        touched = await cleanup_sessions_once()
+        logger.debug("Session cleanup touched %s keys", touched)
+
+
+def start_session_cleanup() -> asyncio.Task:
+    """Start the periodic cleanup loop, keeping a handle to the task."""
+
+    global _cleanup_task  # noqa: PLW0603
+    if _cleanup_task is None or _cleanup_task.done():
+        _cleanup_task = asyncio.get_running_loop().create_task(_cleanup_loop())
+    return _cleanup_task
+
+
+async def stop_session_cleanup() -> None:
+    """Cancel the cleanup loop if running."""
+
+    global _cleanup_task  # noqa: PLW0603
+    if _cleanup_task is not None:
+        _cleanup_task.cancel()
+        try:
+            await _cleanup_task
+        except asyncio.CancelledError:
+            pass
+        _cleanup_task = None
+
+
+__all__ = ["cleanup_sessions_once", "start_session_cleanup", "stop_session_cleanup"]
@@ -0,0 +1,117 @@
+"""Proactive background refresh of Google OAuth tokens."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from app.services.calendar_auth import list_expiring_tokens, save_calendar_token
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 60
+EXPIRY_WINDOW_SECONDS = 300
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def _refresh_google_credentials(row: Dict[str, Any]) -> Optional[Any]:
+    """Refresh a stored Google token synchronously (network I/O)."""
+
+    try:
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+    except ImportError:
+        logger.warning("Google auth libraries unavailable; skipping token refresh.")
+        return None
+
+    from app.integrations.calendar.google_calendar import (
+        GOOGLE_CLIENT_ID,
+        GOOGLE_CLIENT_SECRET,
+    )
+
+    token_data = row.get("token_data") or {}
+    credentials = Credentials(
+        token=row["access_token"],
+        refresh_token=row["refresh_token"],
+        token_uri=token_data.get("token_uri", "https://oauth2.googleapis.com/token"),
+        client_id=GOOGLE_CLIENT_ID,
+        client_secret=GOOGLE_CLIENT_SECRET,
+        scopes=token_data.get("scopes"),
+    )
+    credentials.refresh(Request())
+    return credentials
+
+
+async def refresh_expiring_tokens_once() -> int:
+    """Refresh Google tokens expiring within the next five minutes.
+
+    Returns the number of tokens refreshed.
+    """
+
+    refreshed = 0
+    rows = await list_expiring_tokens(EXPIRY_WINDOW_SECONDS, provider="google")
+
+    for row in rows:
+        try:
+            credentials = await asyncio.get_running_loop().run_in_executor(
+                None, _refresh_google_credentials, row
+            )
+            if credentials is None:
+                continue
+
+            await save_calendar_token(
+                user_id=row["user_id"],
+                provider="google",
+                access_token=credentials.token,
+                refresh_token=credentials.refresh_token or row["refresh_token"],
+                token_expiry=credentials.expiry,
+                token_data={
+                    "scopes": credentials.scopes,
+                    "token_uri": credentials.token_uri,
+                },
+            )
+            refreshed += 1
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to refresh Google token for user %s: %s", row["user_id"], exc
+            )
+
+    return refreshed
+
+
+async def _refresh_loop() -> None:
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+        refreshed = await refresh_expiring_tokens_once()
+        if refreshed:
+            logger.info("Proactively refreshed %s Google tokens", refreshed)
+
+
+def start_token_refresh() -> asyncio.Task:
+    """Start the refresh loop, keeping a handle to the task."""
+
+    global _refresh_task  # noqa: PLW0603
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.get_running_loop().create_task(_refresh_loop())
+    return _refresh_task
+
+
+async def stop_token_refresh() -> None:
+    """Cancel the refresh loop if running."""
+
+    global _refresh_task  # noqa: PLW0603
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
+
+
+__all__ = [
+    "refresh_expiring_tokens_once",
+    "start_token_refresh",
+    "stop_token_refresh",
+]
@@ -13,9 +13,11 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
-import httpx
+import orjson
 from dotenv import load_dotenv
 
+from app.integrations._http import get_sync_client
+
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -39,12 +41,14 @@ class FallbackMemoryClient:
             base_url: Base URL for the Mem0 microservice (default: http://127.0.0.1:8081)
         """
         self.base_url = base_url or MEMO_BASE_URL
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Requests go through the shared keep-alive client so repeated
+        # memory calls reuse one connection pool instead of handshaking
+        # per request.
+        self.client = get_sync_client()
         logger.info(f"FallbackMemoryClient initialized with base URL: {self.base_url}")
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed at application shutdown."""
 
     def add(
         self,
@@ -65,13 +69,13 @@ class FallbackMemoryClient:
         """
         try:
             # Call custom Mem0 microservice
-            response = httpx.post(
+            response = self.client.post(
                 f"{self.base_url}/memories",
                 json={"messages": messages, "user_id": user_id},
                 timeout=30.0,
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as exc:
             logger.exception(f"Failed to add memory via fallback client: {exc}")
             raise RuntimeError(f"Failed to add memory: {exc}") from exc
@@ -97,13 +101,13 @@ class FallbackMemoryClient:
         """
         try:
             # Call custom Mem0 microservice
-            response = httpx.get(
+            response = self.client.get(
                 f"{self.base_url}/memories/search",
                 params={"q": query, "user_id": user_id, "k": limit},
                 timeout=30.0,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("results", [])
         except Exception as exc:
             logger.exception(f"Failed to search memories via fallback client: {exc}")
@@ -126,13 +130,13 @@ class FallbackMemoryClient:
         """
         try:
             # Use search with empty query to get all
-            response = httpx.get(
+            response = self.client.get(
                 f"{self.base_url}/memories/search",
                 params={"q": "", "user_id": user_id, "k": limit or 100},
                 timeout=30.0,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("results", [])
         except Exception as exc:
             logger.exception(f"Failed to get all memories via fallback client: {exc}")
@@ -166,13 +170,13 @@ class FallbackMemoryClient:
         """
         try:
             # Call custom Mem0 microservice
-            response = httpx.post(
+            response = self.client.post(
                 f"{self.base_url}/reset",
                 json={"user_id": user_id},
                 timeout=30.0,
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as exc:
             logger.exception(f"Failed to reset memories via fallback client: {exc}")
             raise RuntimeError(f"Failed to reset memories: {exc}") from exc
@@ -7,10 +7,12 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from app.core import db
+from app.core import cache, db
 
 logger = logging.getLogger(__name__)
 
+CONNECTION_CACHE_TTL = 60
+
 CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS calendar_tokens (
     id SERIAL PRIMARY KEY,
@@ -42,6 +44,16 @@ async def _ensure_table() -> None:
         TABLE_READY = True
 
 
+async def _invalidate_connection_cache(user_id: str, provider: str) -> None:
+    """Drop cached connection-status entries after a connect/disconnect."""
+
+    try:
+        client = await cache.get_client()
+        await client.delete(f"conn:{user_id}:{provider}", f"conn:{user_id}:list")
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to invalidate connection cache for %s: %s", user_id, exc)
+
+
 async def save_calendar_token(
     user_id: str,
     provider: str,
@@ -90,6 +102,7 @@ async def save_calendar_token(
             ),
         )
         logger.info(f"Saved {provider} token for user {user_id}")
+        await _invalidate_connection_cache(user_id, provider)
         return True
     except Exception as exc:
         logger.exception(f"Failed to save calendar token: {exc}")
@@ -163,6 +176,7 @@ async def delete_calendar_token(user_id: str, provider: str) -> bool:
 
         if record:
             logger.info(f"Disconnected {provider} calendar for user {user_id}")
+            await _invalidate_connection_cache(user_id, provider)
             return True
         return False
     except Exception as exc:
@@ -182,6 +196,14 @@ async def list_connected_calendars(user_id: str) -> List[Dict[str, Any]]:
     """
     await _ensure_table()
 
+    cache_key = f"conn:{user_id}:list"
+    try:
+        cached = await cache.get_value(cache_key)
+        if cached is not None:
+            return json.loads(cached)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Connection list cache read failed: %s", exc)
+
     try:
         records = await db.fetch_all(
             """
@@ -193,7 +215,7 @@ async def list_connected_calendars(user_id: str) -> List[Dict[str, Any]]:
             (user_id,),
         )
 
-        return [
+        connected = [
             {
                 "provider": record[0],
                 "connected_at": record[1].isoformat() if record[1] else None,
@@ -201,11 +223,62 @@ async def list_connected_calendars(user_id: str) -> List[Dict[str, Any]]:
             }
             for record in records
         ]
+        try:
+            await cache.set_value(cache_key, json.dumps(connected), ttl=CONNECTION_CACHE_TTL)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Connection list cache write failed: %s", exc)
+        return connected
     except Exception as exc:
         logger.exception(f"Failed to list connected calendars: {exc}")
         return []
 
 
+async def list_expiring_tokens(
+    within_seconds: int,
+    provider: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List tokens across all users that expire within the given window.
+
+    Args:
+        within_seconds: Expiry window in seconds from now
+        provider: Optional provider filter (google, microsoft, apple)
+
+    Returns:
+        List of token rows with user_id, provider, refresh_token, token_data
+    """
+    await _ensure_table()
+
+    query = """
+        SELECT user_id, provider, access_token, refresh_token, token_expiry, token_data
+        FROM calendar_tokens
+        WHERE refresh_token IS NOT NULL
+          AND token_expiry IS NOT NULL
+          AND token_expiry < NOW() + %s * INTERVAL '1 second'
+    """
+    params: List[Any] = [within_seconds]
+    if provider:
+        query += " AND provider = %s"
+        params.append(provider)
+
+    try:
+        records = await db.fetch_all(query, tuple(params))
+        return [
+            {
+                "user_id": record[0],
+                "provider": record[1],
+                "access_token": record[2],
+                "refresh_token": record[3],
+                "token_expiry": record[4],
+                "token_data": json.loads(record[5]) if record[5] else {},
+            }
+            for record in records
+        ]
+    except Exception as exc:
+        logger.exception(f"Failed to list expiring tokens: {exc}")
+        return []
+
+
 async def is_calendar_connected(user_id: str, provider: str) -> bool:
     """
     Check if a calendar provider is connected for a user.
@@ -217,8 +290,21 @@ async def is_calendar_connected(user_id: str, provider: str) -> bool:
     Returns:
         True if connected
     """
+    cache_key = f"conn:{user_id}:{provider}"
+    try:
+        cached = await cache.get_value(cache_key)
+        if cached is not None:
+            return cached == "1"
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Connection status cache read failed: %s", exc)
+
     token = await get_calendar_token(user_id, provider)
-    return token is not None
+    connected = token is not None
+    try:
+        await cache.set_value(cache_key, "1" if connected else "0", ttl=CONNECTION_CACHE_TTL)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Connection status cache write failed: %s", exc)
+    return connected
 
 
 __all__ = [
@@ -226,5 +312,6 @@ __all__ = [
     "get_calendar_token",
     "delete_calendar_token",
     "list_connected_calendars",
+    "list_expiring_tokens",
     "is_calendar_connected",
 ]
@@ -23,6 +23,8 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
 from typing import Any, Dict, List, Optional
@@ -31,6 +33,19 @@ from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+
+async def _call_client(fn: Any, **kwargs: Any) -> Any:
+    """Run a blocking Mem0 client call on the default executor.
+
+    The Mem0 client is synchronous (each call is a full HTTP round
+    trip), and these coroutines are awaited on shared event loops —
+    the crew tools' single loop thread in particular — where an inline
+    call would stall every other coroutine for the duration.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(fn, **kwargs)
+    )
+
 # Load environment variables
 load_dotenv()
 
@@ -191,7 +206,7 @@ async def add_memory(
             kwargs["metadata"] = metadata
 
         # Add memory
-        result = client.add(**kwargs)
+        result = await _call_client(client.add, **kwargs)
 
         logger.info(f"Memory added for user {user_id}: {result}")
         return {"success": True, "result": result}
@@ -236,7 +251,7 @@ async def search_memory(
             kwargs["filters"] = filters
 
         # Search memories
-        results = client.search(**kwargs)
+        results = await _call_client(client.search, **kwargs)
 
         logger.debug(f"Memory search for user {user_id}: {len(results)} results")
         return {"success": True, "results": results}
@@ -271,7 +286,7 @@ async def get_all_memories(
         if limit:
             kwargs["limit"] = limit
 
-        memories = client.get_all(**kwargs)
+        memories = await _call_client(client.get_all, **kwargs)
 
         logger.debug(f"Retrieved {len(memories)} memories for user {user_id}")
         return {"success": True, "memories": memories}
@@ -302,7 +317,7 @@ async def delete_memory(
         client = get_memory_client()
 
         # Delete memory
-        client.delete(memory_id=memory_id)
+        await _call_client(client.delete, memory_id=memory_id)
 
         logger.info(f"Memory {memory_id} deleted for user {user_id}")
         return {"success": True, "deleted": True}
@@ -329,7 +344,7 @@ async def reset_user_memories(user_id: str) -> Dict[str, Any]:
         client = get_memory_client()
 
         # Reset memories
-        client.reset(user_id=user_id)
+        await _call_client(client.reset, user_id=user_id)
 
         logger.info(f"All memories reset for user {user_id}")
         return {"success": True, "reset": True}
@@ -366,7 +381,7 @@ async def update_memory(
         client = get_memory_client()
 
         # Update memory
-        result = client.update(memory_id=memory_id, data=data)
+        result = await _call_client(client.update, memory_id=memory_id, data=data)
 
         logger.info(f"Memory {memory_id} updated for user {user_id}")
         return {"success": True, "result": result}
@@ -397,7 +412,7 @@ async def get_memory_history(
         client = get_memory_client()
 
         # Get history
-        history = client.history(user_id=user_id, limit=limit)
+        history = await _call_client(client.history, user_id=user_id, limit=limit)
 
         logger.debug(f"Retrieved {len(history)} history items for user {user_id}")
         return {"success": True, "history": history}
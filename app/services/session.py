@@ -0,0 +1,98 @@
+"""Redis-backed conversation session store for chat interfaces."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import msgspec
+
+from app.core.cache import get_client
+
+logger = logging.getLogger(__name__)
+
+HISTORY_MAX_LENGTH = 50
+
+
+class Turn(msgspec.Struct, kw_only=True):
+    """One conversation turn as stored in the session history."""
+
+    user: str
+    assistant: str
+    agent: Optional[str] = None
+    ts: float = 0.0
+
+
+# Shared codec instances; msgspec encodes Structs and dicts alike
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder()
+
+
+class SessionStore:
+    """Per-user conversation history kept in Redis.
+
+    All writes for a turn are queued on a single pipeline so one round
+    trip covers the history appends and the activity timestamp update.
+    """
+
+    def _history_key(self, user_id: str) -> str:
+        return f"session:{user_id}:history"
+
+    def _activity_key(self, user_id: str) -> str:
+        return f"session:{user_id}:last_active"
+
+    async def get_context(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Return the most recent history entries for the user."""
+
+        try:
+            client = await get_client()
+            raw_entries = await client.lrange(self._history_key(user_id), -limit, -1)
+            return [_decoder.decode(entry) for entry in raw_entries]
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to read session context for %s: %s", user_id, exc)
+            return []
+
+    async def flush_session(
+        self, user_id: str, updates: List[Union[Dict[str, Any], Turn]]
+    ) -> None:
+        """Persist a turn's history entries in a single pipelined round trip."""
+
+        if not updates:
+            return
+
+        try:
+            client = await get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                history_key = self._history_key(user_id)
+                for update in updates:
+                    pipe.rpush(history_key, _encoder.encode(update))
+                pipe.ltrim(history_key, -HISTORY_MAX_LENGTH, -1)
+                pipe.set(self._activity_key(user_id), str(time.time()))
+                await pipe.execute()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to flush session for %s: %s", user_id, exc)
+
+
+    async def append_turn(self, user_id: str, turn: Union[Dict[str, Any], Turn]) -> None:
+        """Store a whole conversation turn as one document.
+
+        A single RPUSH per turn halves the Redis commands and JSON encode
+        cost compared to separate user/assistant entries.
+        """
+
+        await self.flush_session(user_id, [turn])
+
+
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Return the singleton session store instance."""
+
+    global _session_store  # noqa: PLW0603
+    if _session_store is None:
+        _session_store = SessionStore()
+    return _session_store
+
+
+__all__ = ["SessionStore", "Turn", "get_session_store"]
@@ -94,11 +94,14 @@ def main():
     print("✓ Ports available")
     print()
 
+    # uvloop is not available on Windows; uvicorn falls back to asyncio there
+    loop_args = ["--loop", "uvloop"] if sys.platform != "win32" else []
+
     # Start Mem0 service
     print("Starting Mem0 microservice on port 8081...")
     mem0_process = subprocess.Popen(
         [sys.executable, "-m", "uvicorn", "app.mem0.server.main:app",
-         "--host", "0.0.0.0", "--port", "8081"],
+         "--host", "0.0.0.0", "--port", "8081", *loop_args],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         universal_newlines=True
@@ -117,7 +120,7 @@ def main():
     print("Starting Jenny main application on port 8044...")
     main_process = subprocess.Popen(
         [sys.executable, "-m", "uvicorn", "app.main:app",
-         "--host", "0.0.0.0", "--port", "8044"],
+         "--host", "0.0.0.0", "--port", "8044", *loop_args],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         universal_newlines=True
@@ -0,0 +1,25 @@
+"""Tests for the keyword fast path of the agent router."""
+
+from app.crew.router import get_router
+
+
+def test_single_domain_keywords_route_directly():
+    router = get_router()
+    assert router.route("remind me to water the plants") == "task_coordinator"
+    assert router.route("what meetings do I have") == "calendar_coordinator"
+    assert router.route("update my notification preferences") == "profile_manager"
+    assert router.route("do you remember my address?") == "memory_keeper"
+
+
+def test_phrases_route_directly():
+    router = get_router()
+    assert router.route("am i free on friday?") == "calendar_coordinator"
+    assert router.route("what did I told you about Alice") == "memory_keeper"
+
+
+def test_priority_order_on_multi_domain_queries():
+    router = get_router()
+    # memory > task > calendar > profile
+    assert router.route("remember this task") == "memory_keeper"
+    assert router.route("add a task to my calendar") == "task_coordinator"
+    assert router.route("schedule time to review my profile") == "calendar_coordinator"
@@ -0,0 +1,28 @@
+"""Tests for the small-talk shortcut in the crew runner."""
+
+from app.crew.crew import (
+    _FAREWELL_REPLIES,
+    _GREETING_REPLIES,
+    _THANKS_REPLIES,
+    _small_talk_reply,
+)
+
+
+def test_exact_small_talk_gets_canned_replies():
+    assert _small_talk_reply("hello") in _GREETING_REPLIES
+    assert _small_talk_reply("thanks") in _THANKS_REPLIES
+    assert _small_talk_reply("bye!") in _FAREWELL_REPLIES
+
+
+def test_whitelisted_tails_still_match():
+    assert _small_talk_reply("thanks a lot!") in _THANKS_REPLIES
+    assert _small_talk_reply("Thank you so much") in _THANKS_REPLIES
+    assert _small_talk_reply("thanks again") in _THANKS_REPLIES
+    assert _small_talk_reply("bye for now") in _FAREWELL_REPLIES
+
+
+def test_actionable_queries_are_not_swallowed():
+    assert _small_talk_reply("thanks remind me tomorrow") is None
+    assert _small_talk_reply("thanks cancel my meeting") is None
+    assert _small_talk_reply("thank you now delete that task") is None
+    assert _small_talk_reply("bye delete my reminders") is None